@@ -98,6 +98,10 @@ class JSONIndexBuilder:
             
             # Parse file using strategy
             symbols, file_info = strategy.parse_file(rel_path, content, self.project_path)
+
+            # The JSON index persists docstring text, so resolve spans while the content is at hand
+            for symbol_info in symbols.values():
+                symbol_info.docstring = symbol_info.get_docstring(content)
             
             logger.debug(f"Parsed {rel_path}: {len(symbols)} symbols ({file_info.language})")
             
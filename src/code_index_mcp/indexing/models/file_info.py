@@ -14,7 +14,7 @@ from .import_call_info import ImportCallInfo
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a source code file."""
     
@@ -59,7 +59,7 @@ class ModuleSpec:
             file_content = None
             with open(self.spec.origin) as mod_file:
                 file_content = mod_file.read()
-            module_symbols, module_file_info = python_strategy.PythonParsingStrategy().parse_file(self.spec.origin, file_content, self.spec.origin, self.venv_pkgs, explore_imports=False)
+            module_symbols, module_file_info = python_strategy.PythonParsingStrategy().parse_file(self.spec.origin, file_content, self.spec.origin, self.venv_pkgs, explore_imports=False, definitions_only=True)
             logger.debug(f"{module_symbols=}")
             logger.debug(f"{module_file_info.symbols=}")
             self._classes = {name: info for name, info in module_symbols.items() if info.type == "class"}
@@ -130,7 +130,7 @@ class ModuleSpec:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportCallInfo:
     """Information about a called code symbol (function, class, method, etc.)."""
     import_spec: ModuleSpec
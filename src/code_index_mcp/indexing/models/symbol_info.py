@@ -2,12 +2,21 @@
 SymbolInfo model for representing code symbols.
 """
 
+import ast
+import inspect
 from dataclasses import dataclass
-from typing import Optional, List, Set
+from types import SimpleNamespace
+from typing import Optional, List, Set, Tuple
 
 
-@dataclass
-class SymbolInfo:
+class _CallerIndex:
+    """Slot for the caller set behind SymbolInfo.add_caller, kept out of the dataclass fields."""
+
+    __slots__ = ("_called_by_seen",)
+
+
+@dataclass(slots=True)
+class SymbolInfo(_CallerIndex):
     """Information about a code symbol (function, class, method, etc.)."""
 
     type: str  # function, class, method, interface, etc.
@@ -18,6 +27,8 @@ class SymbolInfo:
     called_by: Optional[List[str]] = None  # list of symbols that call this symbol
     stack_levels: Optional[Set[int]] = None
     decorator_list: Optional[List[str]] = None
+    # (lineno, col_offset, end_lineno, end_col_offset) of the docstring literal
+    docstring_span: Optional[Tuple[int, int, int, int]] = None
 
     def __post_init__(self):
         """Initialize mutable defaults."""
@@ -27,3 +38,55 @@ class SymbolInfo:
             self.stack_levels = set()
         if self.decorator_list is None:
             self.decorator_list = []
+
+    def add_caller(self, caller: str) -> bool:
+        """
+        Record a caller in called_by unless it is already there.
+
+        Membership is checked against a set built from called_by on first use,
+        so symbols with many callers do not pay for a list scan on every call.
+
+        Args:
+            caller: Symbol ID of the calling function
+
+        Returns:
+            True if the caller was added, False if it was already recorded
+        """
+        seen = getattr(self, "_called_by_seen", None)
+        if seen is None:
+            seen = self._called_by_seen = set(self.called_by)
+        if caller in seen:
+            return False
+        seen.add(caller)
+        self.called_by.append(caller)
+        return True
+
+    def get_docstring(self, content: Optional[str] = None) -> Optional[str]:
+        """
+        Get the documentation string for this symbol.
+
+        Args:
+            content: Source of the file the symbol was parsed from, used when
+                only the docstring span was recorded
+
+        Returns:
+            The cleaned docstring, or None if there is none or it cannot be read
+        """
+        if self.docstring is not None or self.docstring_span is None or content is None:
+            return self.docstring
+        lineno, col_offset, end_lineno, end_col_offset = self.docstring_span
+        segment = ast.get_source_segment(
+            content,
+            SimpleNamespace(
+                lineno=lineno,
+                col_offset=col_offset,
+                end_lineno=end_lineno,
+                end_col_offset=end_col_offset,
+            ),
+        )
+        try:
+            # Parenthesised so implicitly concatenated literals spanning lines still evaluate
+            text = ast.literal_eval(f"({segment})")
+        except (SyntaxError, ValueError, TypeError):
+            return None
+        return inspect.cleandoc(text) if isinstance(text, str) else None
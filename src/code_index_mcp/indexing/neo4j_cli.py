@@ -116,6 +116,10 @@ def main():
     neo4j_group.add_argument("--neo4j-password", default="password", help="Neo4j password")
     neo4j_group.add_argument("--neo4j-database", default="neo4j", help="Neo4j database name")
     neo4j_group.add_argument("--config-path", help="Path to Neo4j configuration file", default=None)
+    neo4j_group.add_argument(
+        "--parse-workers", type=int, default=None,
+        help="Worker processes for parsing Python files (default: parse in-process)"
+    )
     
     # Clustering options
     clustering_group = parser.add_argument_group("Clustering Options")
@@ -139,6 +143,7 @@ def main():
     # Set project path and config path if provided
     if args.config_path:
         manager.config_path = args.config_path
+    manager.parse_workers = args.parse_workers
         
     manager.set_project_path(args.project_path)
     
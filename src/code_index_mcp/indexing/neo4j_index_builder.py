@@ -5,23 +5,34 @@ This implements a Neo4j-based index builder using the Strategy pattern
 for language parsing, similar to the JSON index builder.
 """
 
+import hashlib
 import logging
+import multiprocessing
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from mcp import ServerSession
 from mcp.server.fastmcp import Context
-from neo4j import GraphDatabase
+from neo4j import Driver, GraphDatabase
 
 from .strategies import StrategyFactory
+from .strategies.python_strategy import PythonParsingStrategy
 from .models import SymbolInfo, FileInfo, ImportCallInfo
-from .utils.symbol_id_normalizer import SymbolIDNormalizer
+from .utils.symbol_id_normalizer import SymbolIDNormalizer, find_site_packages
 
 logger = logging.getLogger(__name__)
 
+# Files handed to the parse worker pool at a time; bounds the source held in memory at once
+PARSE_BATCH_SIZE = 256
+# Fewer Python files than this are parsed in-process; pickling them to workers costs more
+MIN_PARALLEL_PARSE_FILES = 32
+# Stored with the index and part of its fingerprint; bump when parsing or symbol IDs change
+INDEX_VERSION = "1.1.0-neo4j"
+
 
 @dataclass
 class Neo4jIndexMetadata:
@@ -36,6 +47,7 @@ class Neo4jIndexMetadata:
     specialized_parsers: int = 0
     fallback_files: int = 0
     venv: Optional[str] = None
+    fingerprint: Optional[str] = None  # compute_fingerprint() of the files the index was built from
 
 
 class Neo4jIndexBuilder:
@@ -58,7 +70,8 @@ class Neo4jIndexBuilder:
         neo4j_database: str = "neo4j",
         additional_excludes: Optional[List[str]] = None,
         venv_path: str = None,
-        
+        parse_workers: Optional[int] = None,
+        driver: Optional[Driver] = None,
     ):
         from ..utils import FileFilter
 
@@ -75,6 +88,7 @@ class Neo4jIndexBuilder:
 
         self.project_path = project_path
         self.venv_path = venv_path if venv_path else None
+        self.parse_workers = parse_workers  # processes for Python parsing (opt-in), None or 1 for in-process
         self.strategy_factory = StrategyFactory()
         self.file_filter = FileFilter(additional_excludes)
         self.in_memory_index = None
@@ -91,18 +105,23 @@ class Neo4jIndexBuilder:
         self.neo4j_user = neo4j_user
         self.neo4j_password = neo4j_password
         self.neo4j_database = neo4j_database
-        self.driver = GraphDatabase.driver(
-            neo4j_uri, auth=(neo4j_user, neo4j_password), database=neo4j_database
-        )
+        # A driver passed in is shared with its owner, who connected it and closes it
+        self._owns_driver = driver is None
+        if driver is not None:
+            self.driver = driver
+        else:
+            self.driver = GraphDatabase.driver(
+                neo4j_uri, auth=(neo4j_user, neo4j_password), database=neo4j_database
+            )
 
-        # Test connection
-        try:
-            with self.driver.session() as session:
-                session.run("RETURN 1")
-            logger.info(f"Connected to Neo4j at {neo4j_uri}")
-        except Exception as e:
-            logger.error(f"Failed to connect to Neo4j: {e}")
-            raise
+            # Test connection
+            try:
+                with self.driver.session(database=self.neo4j_database) as session:
+                    session.run("RETURN 1")
+                logger.info(f"Connected to Neo4j at {neo4j_uri}")
+            except Exception as e:
+                logger.error(f"Failed to connect to Neo4j: {e}")
+                raise
 
         logger.info(f"Initialized Neo4j index builder for {project_path}")
         strategy_info = self.strategy_factory.get_strategy_info()
@@ -117,7 +136,7 @@ class Neo4jIndexBuilder:
 
     def _mark_cross_file_calls(self):
         """Mark relationships that cross file boundaries."""
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             session.run("""
                 MATCH (caller_file:File)-[:CONTAINS]->(caller:Symbol)-[:CALLS]->(called:Symbol)<-[:CONTAINS]-(called_file:File)
                 WHERE caller_file.path <> called_file.path
@@ -127,7 +146,7 @@ class Neo4jIndexBuilder:
 
     def _validate_cross_file_calls(self):
         """Validate that cross-file calls are being captured."""
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             result = session.run("""
                 MATCH (caller_file:File)-[:CONTAINS]->(caller:Symbol)-[:CALLS]->(called:Symbol)<-[:CONTAINS]-(called_file:File)
                 WHERE caller_file.path <> called_file.path
@@ -181,21 +200,37 @@ class Neo4jIndexBuilder:
 
         # Get specialized extensions for tracking
         specialized_extensions = set(self.strategy_factory.get_specialized_extensions())
+        parse_executor = None
 
         try:
             # Clear existing index
             self._clear_existing_index()
 
+            # Re-resolve imports, the project or its venv may have changed since the last build
+            PythonParsingStrategy.clear_import_spec_cache()
+
             # Create constraints and indexes
             self._create_schema_constraints()
 
             # Traverse project files
             import_calls: Dict[str, Dict[str, ImportCallInfo]] = {}
             num_steps = len(files:=self._get_supported_files()) + (1 if run_clustering else 0)
+            fingerprint = self.compute_fingerprint(files)
+            # One pool serves every batch of this build
+            parse_executor = self._start_parse_pool(len(files))
+            parsed_batch = {}
             for file_num, file_path in enumerate(files):
+                if file_num % PARSE_BATCH_SIZE == 0:
+                    parsed_batch = self._parse_python_batch(
+                        files[file_num:file_num + PARSE_BATCH_SIZE], parse_executor
+                    )
                 try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
+                    if file_path in parsed_batch:
+                        content, parsed = parsed_batch.pop(file_path)
+                    else:
+                        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                            content = f.read()
+                        parsed = None
 
                     ext = Path(file_path).suffix.lower()
 
@@ -214,16 +249,18 @@ class Neo4jIndexBuilder:
                         fallback_count += 1
 
                     # Parse file using strategy with relative path and normalizer
-                    symbols, file_info = strategy.parse_file(
-                        rel_path, content, self.project_path, self.venv_path,
-                        # normalizer=self.normalizer
-                    )
+                    if parsed is None:
+                        parsed = strategy.parse_file(
+                            rel_path, content, self.project_path, self.venv_path,
+                            # normalizer=self.normalizer
+                        )
+                    symbols, file_info = parsed
 
                     # Add file to Neo4j
                     self._add_file_to_neo4j(file_info)
 
                     for symbol_id, symbol_info in symbols.items():
-                        self._add_symbol_to_neo4j(symbol_id, symbol_info, file_info)
+                        self._add_symbol_to_neo4j(symbol_id, symbol_info, file_info, content)
 
                     languages.add(file_info.language)
                     total_files += 1
@@ -280,12 +317,13 @@ class Neo4jIndexBuilder:
                 project_path=self.project_path,
                 venv=self.venv_path,
                 indexed_files=total_files,
-                index_version="1.0.0-neo4j",
+                index_version=INDEX_VERSION,
                 timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                 languages=sorted(list(languages)),
                 total_symbols=total_symbols,
                 specialized_parsers=specialized_count,
                 fallback_files=fallback_count,
+                fingerprint=fingerprint,
             )
             metadata_dict = asdict(metadata)
             metadata_dict.update(clustering_metadata)
@@ -306,6 +344,10 @@ class Neo4jIndexBuilder:
             logger.exception(f"Error building Neo4j index: {e}")
             return False
 
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
+
     def run_kmeans_clustering(self, k, max_iterations, embedding_dimensions=20):
         logger.info("Computing features and running clustering...")
         self._compute_features(embedding_dimensions)
@@ -323,13 +365,13 @@ class Neo4jIndexBuilder:
 
     def _clear_existing_index(self):
         """Clear the existing Neo4j index."""
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             session.run("MATCH (n) DETACH DELETE n")
         logger.info("Cleared existing Neo4j index")
 
     def _create_schema_constraints(self):
         """Create Neo4j schema constraints and indexes."""
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             # Create constraints
             session.run(
                 "CREATE CONSTRAINT file_path IF NOT EXISTS FOR (f:File) REQUIRE f.path IS UNIQUE"
@@ -346,6 +388,16 @@ class Neo4jIndexBuilder:
                 "CREATE INDEX symbol_name IF NOT EXISTS FOR (s:Symbol) ON (s.name)"
             )
 
+            # Create text index so file searches can use ENDS WITH on paths
+            try:
+                session.run(
+                    "CREATE TEXT INDEX file_path_text IF NOT EXISTS FOR (f:File) ON (f.path)"
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Could not create text index (requires Neo4j 4.4 or later): {e}"
+                )
+
             # Create fulltext index for search
             try:
                 session.run(
@@ -360,7 +412,7 @@ class Neo4jIndexBuilder:
 
     def _add_file_to_neo4j(self, file_info: FileInfo):
         """Add a file to the Neo4j database."""
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             # Create file node
             session.run(
                 """
@@ -398,11 +450,94 @@ class Neo4jIndexBuilder:
             #     self._add_file_to_neo4j()
                 
 
+    def _start_parse_pool(self, file_count: int) -> Optional[ProcessPoolExecutor]:
+        """
+        Start the worker pool for Python parsing, or return None to parse in-process.
+
+        Parsing in worker processes is opt-in through parse_workers > 1, and only
+        pays off once there are enough files to outweigh pickling sources and
+        results. Workers are spawned rather than forked, since the MCP server
+        process is threaded.
+
+        Args:
+            file_count: Number of files the build will go through
+        """
+        if not self.parse_workers or self.parse_workers < 2:
+            return None
+        if file_count < MIN_PARALLEL_PARSE_FILES:
+            return None
+        try:
+            return ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        except Exception as e:
+            logger.warning(f"Could not start Python parse workers, parsing in-process instead: {e}")
+            return None
+
+    def _parse_python_batch(
+        self, file_paths: List[str], executor: Optional[ProcessPoolExecutor]
+    ) -> Dict[str, Tuple[str, Tuple[Dict[str, SymbolInfo], FileInfo]]]:
+        """
+        Read and parse the Python files among file_paths in worker processes.
+
+        Python parsing is CPU-bound pure Python, so processes rather than threads
+        are needed to use more than one core. Anything not returned here (other
+        languages, unreadable files, or every file when there is no pool, too few
+        files, or the pool fails) is left for the caller to read and parse
+        in-process as before.
+
+        Args:
+            file_paths: Files of the current batch
+            executor: Pool from _start_parse_pool, None to parse in-process
+
+        Returns:
+            Map of file path -> (content, (symbols, file_info))
+        """
+        if executor is None:
+            return {}
+
+        paths, jobs = [], []
+        for file_path in file_paths:
+            strategy = self.strategy_factory.get_strategy(Path(file_path).suffix.lower())
+            if not isinstance(strategy, PythonParsingStrategy):
+                continue
+            try:
+                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except OSError:
+                continue
+            rel_path = os.path.relpath(file_path, self.project_path).replace("\\", "/")
+            paths.append(file_path)
+            jobs.append((rel_path, content))
+
+        # Not worth the pickling for a handful of files, e.g. the last batch
+        if len(jobs) < MIN_PARALLEL_PARSE_FILES:
+            return {}
+
+        try:
+            results = PythonParsingStrategy.parse_many(
+                jobs,
+                self.project_path,
+                self.venv_path,
+                max_workers=self.parse_workers,
+                executor=executor,
+            )
+        except Exception as e:
+            logger.warning(f"Parallel Python parsing failed, parsing in-process instead: {e}")
+            return {}
+        return {
+            file_path: (content, result)
+            for file_path, (_, content), result in zip(paths, jobs, results)
+        }
+
     def _add_symbol_to_neo4j(
-        self, symbol_id: str, symbol_info: SymbolInfo, file_info: FileInfo
+        self, symbol_id: str, symbol_info: SymbolInfo, file_info: FileInfo, content: Optional[str] = None
     ):
-        """Add a symbol to the Neo4j database using MERGE to avoid constraint violations."""
-        with self.driver.session() as session:
+        """Add a symbol to the Neo4j database using MERGE to avoid constraint violations.
+
+        The file content, when given, is used to read docstrings that were only recorded as spans.
+        """
+        with self.driver.session(database=self.neo4j_database) as session:
             # Create or match the file node
             session.run(
                 """
@@ -438,7 +573,7 @@ class Neo4jIndexBuilder:
                     "type": symbol_info.type,
                     "line": symbol_info.line,
                     "signature": symbol_info.signature,
-                    "docstring": symbol_info.docstring,
+                    "docstring": symbol_info.get_docstring(content),
                     "path": symbol_info.file,
                     "call_depths": list(symbol_info.stack_levels),
                     "decorator_list": symbol_info.decorator_list,
@@ -571,7 +706,7 @@ class Neo4jIndexBuilder:
         
         import_symbol_info = import_call.called_symbol_info
         import_symbol_id = import_call.called_symbol_id
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             # TODO make same as symbols?
             session.run(  # The file with the imports
                 """
@@ -695,7 +830,7 @@ class Neo4jIndexBuilder:
 
     def _store_index_metadata(self, metadata: Dict[str, Any]):
         """Store index metadata in Neo4j."""
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             session.run(
                 """
                 CREATE (m:IndexMetadata)
@@ -705,6 +840,40 @@ class Neo4jIndexBuilder:
             )
         logger.info("Stored index metadata in Neo4j")
 
+    def compute_fingerprint(self, files: Optional[List[str]] = None) -> str:
+        """
+        Fingerprint the supported files by path, size and modification time.
+
+        The index version and the venv are included too, as calls into imported
+        modules resolve against the venv's site-packages; installing or removing
+        a package changes the modification time of its site-packages directory.
+
+        Args:
+            files: Supported file paths, if already listed
+
+        Returns:
+            Hex digest that changes when a supported file is added, removed or
+            modified, the venv's packages change, or the index format changes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{INDEX_VERSION}\0{self.venv_path}\n".encode("utf-8", "surrogatepass"))
+        if self.venv_path:
+            for site_packages in sorted(find_site_packages(os.path.abspath(self.venv_path))):
+                try:
+                    mtime_ns = os.stat(site_packages).st_mtime_ns
+                except OSError:
+                    continue
+                digest.update(f"{site_packages}\0{mtime_ns}\n".encode("utf-8", "surrogatepass"))
+        for file_path in sorted(self._get_supported_files() if files is None else files):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            digest.update(
+                f"{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8", "surrogatepass")
+            )
+        return digest.hexdigest()
+
     def _get_supported_files(self) -> List[str]:
         """
         Get all supported files in the project using centralized filtering.
@@ -750,7 +919,7 @@ class Neo4jIndexBuilder:
             if file_path.startswith("./"):
                 file_path = file_path[2:]
 
-            with self.driver.session() as session:
+            with self.driver.session(database=self.neo4j_database) as session:
                 result = session.run(
                     """
                     MATCH (f:File {path: $path})-[:CONTAINS]->(s:Symbol)
@@ -797,7 +966,7 @@ class Neo4jIndexBuilder:
             List of matching symbols
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.neo4j_database) as session:
                 if symbol_type:
                     result = session.run(
                         """
@@ -851,7 +1020,7 @@ class Neo4jIndexBuilder:
             List of qualified names of symbols that call the given symbol
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.neo4j_database) as session:
                 result = session.run(
                     """
                     MATCH (caller:Symbol)-[:CALLS]->(called:Symbol {qualified_name: $symbol_name})
@@ -877,7 +1046,7 @@ class Neo4jIndexBuilder:
             Dictionary with callers and called symbols
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.neo4j_database) as session:
                 # Get symbols called by this symbol
                 called_result = session.run(
                     """
@@ -910,7 +1079,7 @@ class Neo4jIndexBuilder:
         """Compute numerical features nodes in the graph."""
         logger.info("Computing features for clustering...")
 
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             # Count outgoing calls for each function
             session.run("""
                 MATCH (f)-[:CALLS]->(other)
@@ -1023,7 +1192,7 @@ class Neo4jIndexBuilder:
         logger.info(f"Running K-means clustering with k={k} for {max_iterations=}...")
 
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.neo4j_database) as session:
                 # Check if GDS library is installed
                 try:
                     session.run("CALL gds.list()")
@@ -1091,7 +1260,7 @@ class Neo4jIndexBuilder:
         """Compute and store statistics for each cluster."""
         logger.info("Computing cluster statistics...")
 
-        with self.driver.session() as session:
+        with self.driver.session(database=self.neo4j_database) as session:
             # Create a ClusterStatistics node if it doesn't exist
             session.run("""
                 MERGE (stats:ClusterStatistics {id: 'cluster_stats'})
@@ -1142,7 +1311,7 @@ class Neo4jIndexBuilder:
             logger.info(f"Clusters: {', '.join(clusters)}")
 
     def close(self):
-        """Close the Neo4j driver."""
-        if self.driver:
+        """Close the Neo4j driver, unless it was passed in by its owner."""
+        if self.driver and self._owns_driver:
             self.driver.close()
             logger.info("Closed Neo4j driver")
@@ -8,11 +8,14 @@ providing a consistent interface for index management.
 import hashlib
 import logging
 import os
+import re
 import tempfile
 import threading
-from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import fnmatch
-from neo4j import GraphDatabase, Driver
+from neo4j import GraphDatabase, Driver, Session
 
 from .neo4j_index_builder import Neo4jIndexBuilder
 from .index_provider import IIndexProvider, IIndexManager, IndexMetadata
@@ -21,24 +24,46 @@ from ..constants import SETTINGS_DIR, NEO4J_CONFIG_FILE
 
 logger = logging.getLogger(__name__)
 
+# Characters that make a glob more than a literal path
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
 
 class Neo4jIndexProvider(IIndexProvider):
     """Neo4j-based index provider implementation."""
 
-    def __init__(self, driver: Driver, project_path: str):
+    def __init__(self, driver: Driver, project_path: str, database: Optional[str] = None):
         self.driver = driver
         self.project_path = project_path
+        # Naming the database saves the server a home-database lookup per session
+        self.database = database
         logger.info("Initialized Neo4j Index Provider")
 
-    def get_cluster_statistics(self) -> List[Dict[str, Any]]:
+    @contextmanager
+    def scoped_session(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """
+        Yield a session that several queries can share.
+
+        Args:
+            session: Session to reuse; when None a new one is opened for the block
+        """
+        if session is not None:
+            yield session
+            return
+        with self.driver.session(database=self.database) as new_session:
+            yield new_session
+
+    def get_cluster_statistics(self, session: Optional[Session] = None) -> List[Dict[str, Any]]:
         """
         Get statistics for all clusters.
 
+        Args:
+            session: Session to run in, from scoped_session (default: a new session)
+
         Returns:
             List of cluster statistics dictionaries
         """
         try:
-            with self.driver.session() as session:
+            with self.scoped_session(session) as session:
                 # First check if clusters exist
                 check_result = session.run("MATCH (c:Cluster) RETURN count(c) as count")
                 check_record = check_result.single()
@@ -67,7 +92,7 @@ class Neo4jIndexProvider(IIndexProvider):
             return []
 
     def get_functions_in_cluster(
-        self, cluster_id: int, limit: int = 100
+        self, cluster_id: int, limit: int = 100, session: Optional[Session] = None
     ) -> List[Dict[str, Any]]:
         """
         Get functions in a specific cluster.
@@ -75,12 +100,13 @@ class Neo4jIndexProvider(IIndexProvider):
         Args:
             cluster_id: Cluster ID
             limit: Maximum number of functions to return (default: 100)
+            session: Session to run in, from scoped_session (default: a new session)
 
         Returns:
             List of function dictionaries
         """
         try:
-            with self.driver.session() as session:
+            with self.scoped_session(session) as session:
                 # First check if the cluster exists
                 check_result = session.run(
                     "MATCH (c:Cluster {id: $cluster_id}) RETURN count(c) as count",
@@ -128,38 +154,52 @@ class Neo4jIndexProvider(IIndexProvider):
         Returns:
             List of cross-file call dictionaries
         """
-        try:
-            with self.driver.session() as session:
-                # First check if there are any cross-file calls
-                check_result = session.run("""
-                    MATCH (caller_file:File)-[:CONTAINS]->(caller:Function)-[:CALLS]->(called:Function)<-[:CONTAINS]-(called_file:File)
-                    WHERE caller_file.path <> called_file.path
-                    RETURN count(*) as count
-                """)
-                check_record = check_result.single()
-                if not check_record or check_record["count"] == 0:
-                    logger.debug("No cross-file calls found in the database")
-                    return []
+        return self.get_cross_file_calls_summary(limit)[1]
 
-                # Get cross-file calls
-                result = session.run(
+    def get_cross_file_calls_summary(
+        self, limit: int = 1000
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Count cross-file function calls and get the first of them.
+
+        Args:
+            limit: Maximum number of cross-file calls to return (default: 1000)
+
+        Returns:
+            Tuple of the total number of cross-file calls and up to limit call dictionaries
+        """
+        try:
+            with self.driver.session(database=self.database) as session:
+                # Count the cross-file calls and collect the first of them in one round trip
+                record = session.run(
                     """
-                    MATCH (caller_file:File)-[:CONTAINS]->(caller:Function)-[:CALLS]->(called:Function)<-[:CONTAINS]-(called_file:File)
-                    WHERE caller_file.path <> called_file.path
-                    RETURN caller.name as caller_name, caller_file.path as caller_file,
-                           called.name as called_name, called_file.path as called_file
-                    LIMIT $limit
+                    CALL {
+                        MATCH (caller_file:File)-[:CONTAINS]->(caller:Function)-[:CALLS]->(called:Function)<-[:CONTAINS]-(called_file:File)
+                        WHERE caller_file.path <> called_file.path
+                        RETURN count(*) as call_count
+                    }
+                    CALL {
+                        MATCH (caller_file:File)-[:CONTAINS]->(caller:Function)-[:CALLS]->(called:Function)<-[:CONTAINS]-(called_file:File)
+                        WHERE caller_file.path <> called_file.path
+                        WITH caller, caller_file, called, called_file LIMIT $limit
+                        RETURN collect({caller_name: caller.name, caller_file: caller_file.path,
+                                        called_name: called.name, called_file: called_file.path}) as calls
+                    }
+                    RETURN call_count, calls
                 """,
                     {"limit": limit},
-                )
+                ).single()
+                if not record or record["call_count"] == 0:
+                    logger.debug("No cross-file calls found in the database")
+                    return 0, []
 
-                calls = [dict(record) for record in result]
-                logger.info(f"Retrieved {len(calls)} cross-file calls")
-                return calls
+                calls = record["calls"]
+                logger.info(f"Retrieved {len(calls)} of {record['call_count']} cross-file calls")
+                return record["call_count"], calls
 
         except Exception as e:
             logger.error(f"Error getting cross-file calls: {e}")
-            return []
+            return 0, []
 
     def get_functions_with_most_cross_file_calls(
         self, limit: int = 20
@@ -174,7 +214,7 @@ class Neo4jIndexProvider(IIndexProvider):
             Dictionary with 'outgoing' and 'incoming' lists of function dictionaries
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 # First check if there are any cross-file calls
                 check_result = session.run("""
                     MATCH (caller_file:File)-[:CONTAINS]->(caller:Function)-[:CALLS]->(called:Function)<-[:CONTAINS]-(called_file:File)
@@ -242,7 +282,7 @@ class Neo4jIndexProvider(IIndexProvider):
             List of file information objects
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 result = session.run("""
                     MATCH (f:File)
                     RETURN f.path as path, f.language as language, 
@@ -269,6 +309,73 @@ class Neo4jIndexProvider(IIndexProvider):
             logger.error(f"Error getting file list: {e}")
             return []
 
+    def get_overview(
+        self, sample_file_limit: int = 5, sample_symbol_limit: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Get file counts and small samples of files and symbols in one query.
+
+        Args:
+            sample_file_limit: Maximum number of files to sample, in path order (default: 5)
+            sample_symbol_limit: Maximum number of symbols to sample from the first file (default: 5)
+
+        Returns:
+            Dictionary with 'file_count', 'files' (FileInfo samples), 'symbol_count' and
+            'symbols' (SymbolInfo samples) of the first sampled file
+        """
+        try:
+            with self.driver.session(database=self.database) as session:
+                record = session.run(
+                    """
+                    CALL { MATCH (f:File) RETURN count(f) as file_count }
+                    CALL {
+                        MATCH (f:File)
+                        WITH f ORDER BY f.path LIMIT $file_limit
+                        RETURN collect(f {.path, .language, .line_count, .imports, .exports}) as files
+                    }
+                    CALL {
+                        WITH files
+                        UNWIND files[0..1] as first
+                        MATCH (:File {path: first.path})-[:CONTAINS]->(s:Symbol)
+                        RETURN count(s) as symbol_count,
+                               collect(s {.type, .line, .signature})[0..$symbol_limit] as symbols
+                    }
+                    RETURN file_count, files, symbol_count, symbols
+                """,
+                    {"file_limit": sample_file_limit, "symbol_limit": sample_symbol_limit},
+                ).single()
+
+                files = [
+                    FileInfo(
+                        file_path=file["path"],
+                        language=file["language"],
+                        line_count=file["line_count"],
+                        symbols={},
+                        imports=file["imports"] or [],
+                        exports=file["exports"] or [],
+                    )
+                    for file in record["files"]
+                ]
+                symbols = [
+                    SymbolInfo(
+                        type=symbol["type"],
+                        file=files[0].file_path,
+                        line=symbol["line"],
+                        signature=symbol["signature"],
+                    )
+                    for symbol in record["symbols"]
+                ]
+                return {
+                    "file_count": record["file_count"],
+                    "files": files,
+                    "symbol_count": record["symbol_count"],
+                    "symbols": symbols,
+                }
+
+        except Exception as e:
+            logger.error(f"Error getting index overview: {e}")
+            return {"file_count": 0, "files": [], "symbol_count": 0, "symbols": []}
+
     def get_file_info(self, file_path: str) -> Optional[FileInfo]:
         """
         Get information for a specific file.
@@ -285,7 +392,7 @@ class Neo4jIndexProvider(IIndexProvider):
             if file_path.startswith("./"):
                 file_path = file_path[2:]
 
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 result = session.run(
                     """
                     MATCH (f:File {path: $path})
@@ -347,7 +454,7 @@ class Neo4jIndexProvider(IIndexProvider):
             if file_path.startswith("./"):
                 file_path = file_path[2:]
 
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 result = session.run(
                     """
                     MATCH (f:File {path: $path})-[:CONTAINS]->(s:Symbol)
@@ -378,10 +485,14 @@ class Neo4jIndexProvider(IIndexProvider):
             logger.error(f"Error querying symbols for {file_path}: {e}")
             return []
 
-    def _glob_to_regex(self, pattern: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _glob_to_regex(pattern: str) -> str:
         """
         Convert glob pattern to regex pattern for Neo4j queries.
 
+        Results are cached, as clients tend to issue the same few patterns repeatedly.
+
         Args:
             pattern: Glob pattern string (e.g., "*.py", "src/*.js")
 
@@ -417,6 +528,50 @@ class Neo4jIndexProvider(IIndexProvider):
 
         return regex_pattern
 
+    def _glob_to_cypher_predicate(self, pattern: str) -> Tuple[str, Dict[str, Any]]:
+        """
+        Convert glob pattern to a Cypher WHERE clause on f.path.
+
+        Literal leading and trailing text becomes STARTS WITH / ENDS WITH, which
+        Neo4j can answer from its indexes; the regex is only kept when wildcards
+        other than * remain between them.
+
+        Args:
+            pattern: Glob pattern string (e.g., "*.py", "src/*.js")
+
+        Returns:
+            Tuple of the WHERE clause (empty if every path matches) and its parameters
+        """
+        first_magic = _GLOB_MAGIC.search(pattern)
+        if not first_magic:
+            # A literal path can use the index behind the file_path constraint
+            return "WHERE f.path = $path", {"path": pattern}
+
+        prefix = pattern[:first_magic.start()]
+        suffix = pattern[max(pattern.rfind(char) for char in "*?[]") + 1:]
+        middle = pattern[len(prefix):len(pattern) - len(suffix)]
+
+        conditions = []
+        params = {}
+        if prefix:
+            conditions.append("f.path STARTS WITH $prefix")
+            params["prefix"] = prefix
+        if suffix:
+            conditions.append("f.path ENDS WITH $suffix")
+            params["suffix"] = suffix
+        if middle.strip("*"):
+            conditions.append("f.path =~ $pattern")
+            params["pattern"] = self._glob_to_regex(pattern)
+        elif prefix and suffix:
+            # * may match nothing, but prefix and suffix must not overlap
+            conditions.append("size(f.path) >= $min_length")
+            params["min_length"] = len(prefix) + len(suffix)
+
+        if not conditions:
+            # Only * wildcards, so every file matches
+            return "", {}
+        return "WHERE " + " AND ".join(conditions), params
+
     def search_files(self, pattern: str) -> List[str]:
         """
         Search files by pattern.
@@ -437,20 +592,17 @@ class Neo4jIndexProvider(IIndexProvider):
             if not pattern:
                 pattern = "*"
 
-            # Convert glob pattern to regex
-            regex_pattern = self._glob_to_regex(pattern)
-            logger.debug(
-                f"Converted glob pattern '{pattern}' to regex '{regex_pattern}'"
-            )
-
-            with self.driver.session() as session:
-                query = """
+            # Convert glob pattern to a predicate on f.path
+            where, params = self._glob_to_cypher_predicate(pattern)
+            logger.debug(f"Converted glob pattern '{pattern}' to '{where}' with {params}")
+            query = f"""
                 MATCH (f:File)
-                WHERE f.path =~ $pattern
+                {where}
                 RETURN f.path as path
                 """
 
-                result = session.run(query, pattern=regex_pattern)
+            with self.driver.session(database=self.database) as session:
+                result = session.run(query, **params)
                 files = [record["path"] for record in result]
 
                 logger.debug(f"Found {len(files)} files matching pattern '{pattern}'")
@@ -468,7 +620,7 @@ class Neo4jIndexProvider(IIndexProvider):
             Index metadata information
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 result = session.run("MATCH (m:IndexMetadata) RETURN m")
 
                 record = result.single()
@@ -523,7 +675,7 @@ class Neo4jIndexProvider(IIndexProvider):
             True if index is available and functional
         """
         try:
-            with self.driver.session() as session:
+            with self.driver.session(database=self.database) as session:
                 result = session.run("MATCH (m:IndexMetadata) RETURN count(m) as count")
                 record = result.single()
                 return record and record["count"] > 0
@@ -549,6 +701,8 @@ class Neo4jIndexManager(IIndexManager):
         self._lock = threading.RLock()
         self.temp_dir = None
         self.venv_path: Optional[str] = None
+        # Worker processes for parsing Python files; None parses in-process
+        self.parse_workers: Optional[int] = None
         logger.info("Initialized Neo4j Index Manager")
 
     def find_files(self, pattern: str = "*") -> List[str]:
@@ -672,7 +826,7 @@ class Neo4jIndexManager(IIndexManager):
                 )
 
                 # Test connection
-                with self.driver.session() as session:
+                with self.driver.session(database=self.neo4j_database) as session:
                     session.run("RETURN 1")
 
                 # Create index builder and provider
@@ -683,9 +837,13 @@ class Neo4jIndexManager(IIndexManager):
                     self.neo4j_password,
                     self.neo4j_database,
                     venv_path=self.venv_path,
+                    parse_workers=self.parse_workers,
+                    driver=self.driver,
                 )
 
-                self.index_provider = Neo4jIndexProvider(self.driver, self.project_path)
+                self.index_provider = Neo4jIndexProvider(
+                    self.driver, self.project_path, database=self.neo4j_database
+                )
                 self._save_neo4j_config()
 
                 logger.info(f"Initialized Neo4j Index Manager for {self.project_path}")
@@ -730,9 +888,30 @@ class Neo4jIndexManager(IIndexManager):
                 return False
 
     def build_index(self, ctx=None, force_rebuild: bool = False) -> bool:
-        """Build or rebuild the index."""
+        """Build or rebuild the index, skipping the rebuild if the stored index is current."""
+        if not force_rebuild and self.is_index_current():
+            logger.info("Neo4j index is current, skipping rebuild")
+            return True
         return self.refresh_index(ctx=ctx)
 
+    def is_index_current(self) -> bool:
+        """Check whether the stored index was built from the project's current files."""
+        with self._lock:
+            if not self.driver or not self.index_builder:
+                return False
+
+            try:
+                with self.driver.session(database=self.neo4j_database) as session:
+                    record = session.run(
+                        "MATCH (m:IndexMetadata) RETURN m.fingerprint as fingerprint LIMIT 1"
+                    ).single()
+                if not record or not record["fingerprint"]:
+                    return False
+                return record["fingerprint"] == self.index_builder.compute_fingerprint()
+            except Exception as e:
+                logger.error(f"Failed to check index fingerprint: {e}")
+                return False
+
     def refresh_index(self, ctx=None) -> bool:
         """Refresh the index (rebuild and reload)."""
         with self._lock:
@@ -791,7 +970,7 @@ class Neo4jIndexManager(IIndexManager):
                 return
 
             try:
-                with self.driver.session() as session:
+                with self.driver.session(database=self.neo4j_database) as session:
                     session.run("MATCH (n) DETACH DELETE n")
                 logger.info("Cleared Neo4j index")
 
@@ -812,7 +991,7 @@ class Neo4jIndexManager(IIndexManager):
                 return {"status": "not_initialized"}
 
             try:
-                with self.driver.session() as session:
+                with self.driver.session(database=self.neo4j_database) as session:
                     # Get node counts
                     result = session.run("""
                         MATCH (f:File) WITH count(f) as file_count
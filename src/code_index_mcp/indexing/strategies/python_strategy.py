@@ -3,9 +3,16 @@ Python parsing strategy using AST - Optimized single-pass version.
 """
 
 import ast
+import hashlib
 import os
+import pickle
+import re
+import sys
 import logging
-from typing import Dict, List, Tuple, Set, Optional
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Sequence
 
 from .base_strategy import ParsingStrategy
 from ..models import SymbolInfo, FileInfo, ImportCallInfo, ModuleSpec
@@ -13,16 +20,118 @@ from ..utils.symbol_id_normalizer import SymbolIDNormalizer
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parse_file output changes so stale cache entries are never read back
+_PARSE_CACHE_VERSION = 4
+# Stores between checks of the cache size, so the directory isn't listed on every write
+_CACHE_EVICT_INTERVAL = 64
+# Import specs remembered across files; find_spec stats the filesystem on every lookup
+_IMPORT_SPEC_CACHE_SIZE = 4096
+
+
+# Line boundaries str.splitlines() honours besides \n and \r\n
+_OTHER_LINE_BREAKS = re.compile("\r(?!\n)|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _count_lines(content: str) -> int:
+    """Count lines like len(content.splitlines()), only building the list for unusual line breaks."""
+    if _OTHER_LINE_BREAKS.search(content):
+        return len(content.splitlines())
+    return content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+
+
+@lru_cache(maxsize=_IMPORT_SPEC_CACHE_SIZE)
+def _resolve_spec(
+    called_import: str, project_dir: str, from_module: Optional[str], venv_root: Optional[str]
+) -> Optional[ModuleSpec]:
+    """Resolve an import spec once per process, as the same imports recur across files."""
+    return ImportCallInfo.get_import_spec(
+        called_import, project_dir, project_dir, from_module, venv_root=venv_root
+    )
+
+
+def _parse_one(
+    job: Tuple[str, str, str, Optional[str], bool],
+) -> Tuple[Dict[str, SymbolInfo], FileInfo]:
+    """Parse a single file in a worker process; module level so it can be pickled."""
+    file_path, content, project_dir, venv_root, explore_imports = job
+    return PythonParsingStrategy().parse_file(
+        file_path, content, project_dir, venv_root, explore_imports=explore_imports
+    )
+
 
 class PythonParsingStrategy(ParsingStrategy):
     """Python-specific parsing strategy using Python's built-in AST - Single Pass Optimized."""
 
+    def __init__(self, cache_dir: Optional[str] = None, cache_max_entries: int = 10000):
+        """
+        Initialize the Python parsing strategy.
+
+        Args:
+            cache_dir: Directory for parse results pickled by content hash, so unchanged
+                files are not re-parsed across runs. Caching is disabled when None, and
+                parses exploring imports are never cached, as they read other files.
+                The index builders don't pass one, so caching is off by default.
+            cache_max_entries: Entries kept in cache_dir; the least recently used are evicted
+        """
+        self.cache_dir = cache_dir
+        self.cache_max_entries = cache_max_entries
+        self._cache_stores = 0
+
+    @staticmethod
+    def clear_import_spec_cache() -> None:
+        """Forget import specs resolved so far, e.g. before re-indexing a changed project."""
+        _resolve_spec.cache_clear()
+
     def get_language_name(self) -> str:
         return "python"
 
     def get_supported_extensions(self) -> List[str]:
         return [".py", ".pyw"]
 
+    @classmethod
+    def parse_many(
+        cls,
+        files: List[Tuple[str, str]],
+        project_dir: str,
+        venv_root: str = None,
+        explore_imports=True,
+        max_workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Tuple[Dict[str, SymbolInfo], FileInfo]]:
+        """
+        Parse many Python files in parallel worker processes.
+
+        Args:
+            files: (file_path, content) pairs to parse
+            project_dir: Project root passed to each parse_file call
+            venv_root: Optional virtual environment root for import resolution
+            explore_imports: Whether to resolve calls into imported modules
+            max_workers: Number of worker processes, defaults to the CPU count
+            chunksize: Files sent to a worker per task, to amortise pickling;
+                by default about four tasks per worker, so the load stays balanced
+            executor: Process pool to reuse across calls; when None a pool of
+                spawned (not forked) workers is started for this call only
+
+        Returns:
+            (symbols, file_info) results in the same order as files
+        """
+        if not files:
+            return []
+        jobs = [
+            (file_path, content, project_dir, venv_root, explore_imports)
+            for file_path, content in files
+        ]
+        if chunksize is None:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(jobs) // (workers * 4))
+        if executor is not None:
+            return list(executor.map(_parse_one, jobs, chunksize=chunksize))
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            return list(executor.map(_parse_one, jobs, chunksize=chunksize))
+
     def parse_file(
         self,
         file_path: str,
@@ -31,8 +140,34 @@ class PythonParsingStrategy(ParsingStrategy):
         venv_root: str = None,
         explore_imports=True,
         normalizer: Optional[SymbolIDNormalizer] = None,
+        definitions_only=False,
     ) -> Tuple[Dict[str, SymbolInfo], FileInfo]:
-        """Parse Python file using AST with single-pass optimization."""
+        """Parse Python file using AST with single-pass optimization.
+
+        With definitions_only the walk only descends through statements, so symbols
+        are recorded without any call analysis (no called_by from calls).
+        """
+        # Blank files have no symbols, so skip parsing and the visitor walk entirely
+        if not content or content.isspace():
+            return {}, FileInfo(
+                file_path=file_path,
+                language=self.get_language_name(),
+                line_count=_count_lines(content),
+                symbols={"functions": [], "classes": []},
+                imports=[],
+            )
+
+        # Normalizers carry per-project state, so only plain symbol IDs are cached; explored
+        # imports depend on other files the content hash does not cover
+        cache_path = None
+        if self.cache_dir and normalizer is None and (definitions_only or not explore_imports):
+            cache_path = self._cache_path(
+                file_path, content, project_dir, venv_root, explore_imports, definitions_only
+            )
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
+
         symbols = {}
         functions = []
         classes = []
@@ -40,9 +175,8 @@ class PythonParsingStrategy(ParsingStrategy):
         import_calls = {}
         import_symbols = {}
         import_call_info_lookup = {}
-        self.explore_imports = explore_imports
         try:
-            tree = ast.parse(content, feature_version=(3, 12))
+            tree = ast.parse(content)
             # Single-pass visitor that handles everything at once
             visitor = SinglePassVisitor(
                 symbols,
@@ -57,6 +191,7 @@ class PythonParsingStrategy(ParsingStrategy):
                 venv_root=venv_root,
                 explore_imports=explore_imports,
                 normalizer=normalizer,
+                definitions_only=definitions_only,
             )
             visitor.visit(tree)
             # Lookup all decorators
@@ -82,31 +217,141 @@ class PythonParsingStrategy(ParsingStrategy):
             #         logger.warning(f"Decorator lookup failed for {decorator_funcname=} {visitor.symbol_lookup.keys()=} {import_call_info_lookup.keys()=}")
             #     docorated_symbol.decorator_list = temp_decorators
 
+            # Release the AST (and the visitor's references into it) before FileInfo is built
+            del tree, visitor
         except SyntaxError as e:
             logger.exception(f"Syntax error in Python file {file_path}: {e}")
         except Exception as e:
             logger.exception(f"Error parsing Python file {file_path}: {e}")
+            # May depend on more than the content (e.g. import resolution), so don't cache it
+            cache_path = None
 
         file_info = FileInfo(
             file_path=file_path,
             language=self.get_language_name(),
-            line_count=len(content.splitlines()),
+            line_count=_count_lines(content),
             symbols={"functions": functions, "classes": classes},
             imports=imports,
             import_calls=import_calls,
             import_symbols=import_symbols,
             import_call_info_lookup=import_call_info_lookup,
         )
-        # try:
-        #     visitor._analyze_import_calls(tree, symbols, file_info, project_dir)
-        # except Exception as e:
-        #     logger.warning(f"Error epanding import calls for Python file {file_path}: {e}", exc_info=True)
+        if cache_path:
+            self._store_cached(cache_path, (symbols, file_info))
         return symbols, file_info
 
+    def _cache_path(
+        self,
+        file_path: str,
+        content: str,
+        project_dir: str,
+        venv_root: Optional[str],
+        explore_imports: bool,
+        definitions_only: bool = False,
+    ) -> str:
+        """Build the cache file path for a parse, keyed by its content and arguments."""
+        digest = hashlib.blake2b(digest_size=16)
+        # Import resolution depends on the interpreter, and results on this module's version
+        digest.update(
+            f"{_PARSE_CACHE_VERSION}\0{tuple(sys.version_info)}\0{sys.version}\0{sys.prefix}\0".encode("utf-8")
+        )
+        digest.update(
+            f"{file_path}\0{project_dir}\0{venv_root}\0{explore_imports}\0{definitions_only}\0".encode("utf-8")
+        )
+        digest.update(content.encode("utf-8", "surrogatepass"))
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.pkl")
+
+    @staticmethod
+    def _load_cached(cache_path: str) -> Optional[Tuple[Dict[str, SymbolInfo], FileInfo]]:
+        """Load a cached parse result, or None on a miss or unreadable entry."""
+        try:
+            with open(cache_path, "rb") as f:
+                result = pickle.load(f)
+            # Refresh the modification time, which orders entries for eviction
+            os.utime(cache_path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable parse cache entry {cache_path}: {e}")
+            return None
+
+    def _store_cached(self, cache_path: str, result: Tuple[Dict[str, SymbolInfo], FileInfo]):
+        """Write a parse result to the cache, replacing any entry atomically."""
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write parse cache entry {cache_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+
+        # Check on the first store too, to trim a cache left large by earlier runs
+        if self._cache_stores % _CACHE_EVICT_INTERVAL == 0:
+            self._evict_cache()
+        self._cache_stores += 1
+
+    def _evict_cache(self):
+        """Remove the least recently used cache entries beyond cache_max_entries."""
+        try:
+            with os.scandir(self.cache_dir) as it:
+                entries = [entry for entry in it if entry.name.endswith(".pkl")]
+            excess = len(entries) - self.cache_max_entries
+            if excess <= 0:
+                return
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+        except OSError as e:
+            logger.debug(f"Could not scan parse cache {self.cache_dir}: {e}")
+            return
+        for entry in entries[:excess]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                # Another process may have evicted it already
+                pass
+
 
 class SinglePassVisitor(ast.NodeVisitor):
     """Single-pass AST visitor that extracts symbols and analyzes calls in one traversal."""
 
+    # Slot descriptors give faster attribute access in the hot visit methods
+    __slots__ = (
+        "symbols",
+        "functions",
+        "classes",
+        "imports",
+        "import_calls",
+        "import_call_info_lookup",
+        "import_symbols",
+        "_imports",
+        "_from_imports",
+        "_import_specs",
+        "_relative_paths",
+        "_imports_by_last_segment",
+        "_imports_seen",
+        "file_path",
+        "_fp_prefix",
+        "project_dir",
+        "venv_root",
+        "explore_imports",
+        "definitions_only",
+        "normalizer",
+        "_no_func_name_nodes",
+        "current_function",
+        "current_depth",
+        "current_class",
+        "symbol_lookup",
+        "method_lookup",
+        "decorator_lookup",
+        "decorations",
+    )
+
     def __init__(
         self,
         symbols: Dict[str, SymbolInfo],
@@ -121,6 +366,7 @@ class SinglePassVisitor(ast.NodeVisitor):
         venv_root: str = None,
         explore_imports=False,
         normalizer: Optional[SymbolIDNormalizer] = None,
+        definitions_only=False,
     ):
         self.symbols = symbols
         self.functions = functions
@@ -131,42 +377,98 @@ class SinglePassVisitor(ast.NodeVisitor):
         self.imports = imports
         self._imports = []  # to keep track of imported symbols
         self._from_imports = {}  # to keep track of imported symbols using from
+        self._import_specs: Dict[str, Optional[ModuleSpec]] = {}  # import -> resolved spec, filled on first use
+        self._relative_paths: Dict[str, str] = {}  # spec origin or file path -> path relative to project_dir
+        self._imports_by_last_segment: Dict[str, List[str]] = {}  # last dotted segment -> imports
+        self._imports_seen = set(imports)  # imports already recorded, keeps self.imports free of repeats
         self.file_path = file_path
+        self._fp_prefix = f"{file_path}::"  # symbol ID prefix for names defined in this file
         self.project_dir = project_dir
         self.venv_root = venv_root
         self.explore_imports = explore_imports
+        self.definitions_only = definitions_only  # walk statements only, skipping expressions and calls
         self.normalizer = normalizer  # Symbol ID normalizer for consistent cross-file references
-        self._no_func_name_nodes = []
+        # (lineno, col_offset, node type), not the nodes, so the AST can be freed
+        self._no_func_name_nodes: List[Tuple[int, int, str]] = []
 
         # Context tracking for call analysis
-        self.current_function_stack = []
+        self.current_function: Optional[str] = None  # ID of the innermost enclosing function
+        self.current_depth = 0  # number of enclosing functions
         self.current_class = None
 
         # Symbol lookup index for O(1) access
         self.symbol_lookup = {}  # name -> symbol_id mapping for fast lookups
+        self.method_lookup = {}  # bare method name -> symbol_id of the first Class.method registered
         self.decorator_lookup = {}  # symbol_id -> decorator_list
         self.decorations = {}
 
-        # Track processed nodes to avoid duplicates
-        self.processed_nodes: Set[int] = set()
+    def visit(self, node: ast.AST):
+        """Visit a node through the type-keyed dispatch table instead of a getattr lookup."""
+        handler = _VISITORS.get(type(node))
+        if handler is None:
+            return self.generic_visit(node)
+        return handler(self, node)
+
+    def generic_visit(self, node: ast.AST):
+        """Visit the children of node iteratively, dispatching straight to visit_ methods.
+
+        Replaces the recursive ast.NodeVisitor walk, which costs a getattr and a
+        Python frame per node.
+        """
+        self._walk([node], root=node)
+
+    def _walk(self, stack: List[ast.AST], root: Optional[ast.AST] = None):
+        """Visit the nodes on stack, last first, and everything below them.
+
+        Nodes with a visit_ method are handed to it, others have their children
+        pushed in reverse so they are still visited in source order. The root,
+        if given, is never dispatched, only expanded.
+        """
+        handlers = _VISITORS
+        iter_fields = ast.iter_fields
+        # Definitions only ever appear in statements, so expressions can be skipped when calls aren't wanted
+        wanted = (ast.stmt, ast.excepthandler, ast.match_case) if self.definitions_only else ast.AST
+        leaves = _LEAF_NODE_TYPES
+        pop = stack.pop
+        while stack:
+            current = pop()
+            if current is not root:
+                handler = handlers.get(type(current))
+                if handler is not None:
+                    handler(self, current)
+                    continue
+            children = []
+            for _, value in iter_fields(current):
+                if isinstance(value, list):
+                    children.extend(
+                        item for item in value if isinstance(item, wanted) and type(item) not in leaves
+                    )
+                elif isinstance(value, wanted) and type(value) not in leaves:
+                    children.append(value)
+            children.reverse()
+            stack.extend(children)
 
     def log_stats(self):
         if self._no_func_name_nodes:
             logger.warning(
-                f"Couldn't derive function names from these {len(self._no_func_name_nodes)} nodes: {self._no_func_name_nodes}"
+                f"Couldn't derive function names from these {len(self._no_func_name_nodes)} nodes "
+                f"(line, column, type) in {self.file_path}: {self._no_func_name_nodes}"
             )
 
     def visit_ClassDef(self, node: ast.ClassDef):
         """Visit class definition - extract symbol and analyze in single pass."""
         class_name = node.name
-        symbol_id = self._create_symbol_id(self.file_path, class_name)
-
-        # Extract docstring
-        docstring = ast.get_docstring(node)
+        if self.normalizer:
+            symbol_id = self._create_symbol_id(self.file_path, class_name)
+        else:
+            symbol_id = sys.intern(self._fp_prefix + class_name)
 
         # Create symbol info
         symbol_info = SymbolInfo(
-            type="class", file=self.file_path, line=node.lineno, docstring=docstring
+            type="class",
+            file=self.file_path,
+            line=node.lineno,
+            docstring_span=self._docstring_span(node),
         )
 
         # Store in symbols and lookup index
@@ -183,8 +485,8 @@ class SinglePassVisitor(ast.NodeVisitor):
             if isinstance(child, ast.FunctionDef):
                 self._handle_method(child, class_name)
             else:
-                # Visit other nodes in class body
-                self.visit(child)
+                # Visit other nodes in class body, in place so source order is kept
+                self._walk([child])
 
         # Restore previous class context
         self.current_class = old_class
@@ -195,19 +497,14 @@ class SinglePassVisitor(ast.NodeVisitor):
         if self.current_class:
             return
 
-        # Skip if already processed
-        node_id = id(node)
-        if node_id in self.processed_nodes:
-            return
-        self.processed_nodes.add(node_id)
-
         func_name = node.name
-        symbol_id = self._create_symbol_id(self.file_path, func_name)
+        # Callers on the stack always use the plain path::name form
+        function_id = sys.intern(self._fp_prefix + func_name)
+        symbol_id = self._create_symbol_id(self.file_path, func_name) if self.normalizer else function_id
 
-        # Extract function signature and docstring
+        # Extract function signature
         signature = self._extract_function_signature(node)
-        docstring = ast.get_docstring(node)
-        called_by = [self.current_function_stack[-1]] if self.current_function_stack else []
+        called_by = [self.current_function] if self.current_function else []
         # called_by += [f"{self.file_path}::{func_name_(decorator)}" for decorator in node.decorator_list]
         # Create symbol info
         symbol_info = SymbolInfo(
@@ -215,9 +512,9 @@ class SinglePassVisitor(ast.NodeVisitor):
             file=self.file_path,
             line=node.lineno,
             signature=signature,
-            docstring=docstring,
+            docstring_span=self._docstring_span(node),
             called_by=called_by,
-            stack_levels={len(self.current_function_stack) + len(node.decorator_list)},
+            stack_levels={self.current_depth + len(node.decorator_list)},
         )
 
         # Store in symbols and lookup index
@@ -227,20 +524,22 @@ class SinglePassVisitor(ast.NodeVisitor):
         self.functions.append(func_name)
 
         # Track function context for call analysis
-        function_id = f"{self.file_path}::{func_name}"
-        self.current_function_stack.append(function_id)
+        outer_function = self.current_function
+        self.current_function = function_id
+        self.current_depth += 1
 
         # Visit function body to analyze calls
         self.generic_visit(node)
 
-        # Pop function from stack
-        self.current_function_stack.pop()
+        # Restore the enclosing function
+        self.current_function = outer_function
+        self.current_depth -= 1
 
     def extract_decorators(self, node: ast.FunctionDef, symbol_id: str, symbol_info: SymbolInfo):
         for decorator in node.decorator_list:
             decorator_func_name = self.try_get_func_name_from_expr(decorator)
-            self.decorator_lookup[decorator_func_name] = self.decorator_lookup.get(decorator_func_name, []) + [decorator]
-            self.decorations[decorator_func_name] = self.decorations.get(decorator_func_name, []) + [symbol_id]
+            self.decorator_lookup.setdefault(decorator_func_name, []).append(decorator)
+            self.decorations.setdefault(decorator_func_name, []).append(symbol_id)
 
             if self.get_matching_imports(decorator_func_name):
                 self.try_as_import_call(decorator, decorator_func_name, caller_function=None)
@@ -260,15 +559,17 @@ class SinglePassVisitor(ast.NodeVisitor):
     def _handle_method(self, node: ast.FunctionDef, class_name: str):
         """Handle method definition within a class."""
         method_name = f"{class_name}.{node.name}"
-        method_symbol_id = self._create_symbol_id(self.file_path, method_name)
+        function_id = sys.intern(self._fp_prefix + method_name)
+        method_symbol_id = (
+            self._create_symbol_id(self.file_path, method_name) if self.normalizer else function_id
+        )
 
         method_signature = self._extract_function_signature(node)
-        method_docstring = ast.get_docstring(node)
 
         # TODO handle decorator_list
         # decorators need to call this symbol
         # logger.warning(f"{node.decorator_list}=")
-        called_by = [self.current_function_stack[-1]] if self.current_function_stack else []
+        called_by = [self.current_function] if self.current_function else []
 
         # We don't know path of the decorator node yet
         # To be used it must have been imported or defined though
@@ -281,9 +582,9 @@ class SinglePassVisitor(ast.NodeVisitor):
             file=self.file_path,
             line=node.lineno,
             signature=method_signature,
-            docstring=method_docstring,
+            docstring_span=self._docstring_span(node),
             called_by=called_by,
-            stack_levels={len(self.current_function_stack) + len(node.decorator_list)},
+            stack_levels={self.current_depth + len(node.decorator_list)},
         )
 
         # Store in symbols and lookup index
@@ -292,38 +593,50 @@ class SinglePassVisitor(ast.NodeVisitor):
         self.symbol_lookup[node.name] = (
             method_symbol_id  # Also index by method name alone
         )
+        self.method_lookup.setdefault(node.name, method_symbol_id)
         self.extract_decorators(node, symbol_id=method_symbol_id, symbol_info=symbol_info)
         self.functions.append(method_name)
 
         # Track method context for call analysis
-        function_id = f"{self.file_path}::{method_name}"
-        self.current_function_stack.append(function_id)
+        outer_function = self.current_function
+        self.current_function = function_id
+        self.current_depth += 1
 
         # Visit method body to analyze calls
-        for child in node.body:
-            self.visit(child)
+        self._walk(node.body[::-1])
 
-        # Pop method from stack
-        self.current_function_stack.pop()
+        # Restore the enclosing function
+        self.current_function = outer_function
+        self.current_depth -= 1
 
     def visit_Import(self, node: ast.Import):
         """Handle import statements."""
         for alias in node.names:
-            self.imports.append(alias.name)
-            self._imports.append(alias.name)
+            if self._add_import(alias.name):
+                self._imports.append(alias.name)
         self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
         """Handle from...import statements."""
         if node.module:
             for alias in node.names:
-                self.imports.append(f"{node.module}.{alias.name}")
-                self._from_imports[f"{node.module}.{alias.name}"] = (
+                import_name = f"{node.module}.{alias.name}"
+                self._add_import(import_name)
+                self._from_imports[import_name] = (
                     node.module,
                     alias.name,
                 )
         self.generic_visit(node)
 
+    def _add_import(self, name: str) -> bool:
+        """Record an import once, indexed by its last dotted segment; returns False for repeats."""
+        if name in self._imports_seen:
+            return False
+        self._imports_seen.add(name)
+        self.imports.append(name)
+        self._imports_by_last_segment.setdefault(name.rsplit(".", 1)[-1], []).append(name)
+        return True
+
     def visit_Call(self, node: ast.Call):
         """Visit function call and record relationship using O(1) lookup."""
 
@@ -332,52 +645,53 @@ class SinglePassVisitor(ast.NodeVisitor):
             try:
                 # Get the function name being called
 
-                if isinstance(node.func, ast.Name):
+                # AST node classes are never subclassed, so identity checks are safe here
+                func = node.func
+                func_type = type(func)
+                if func_type is ast.Name:
                     # Direct function call: function_name()
-                    called_function = node.func.id
-                elif isinstance(node.func, ast.Attribute):
+                    called_function = func.id
+                elif func_type is ast.Attribute:
                     # Method call: obj.method() or module.function()
-                    called_function = node.func.attr
+                    called_function = func.attr
                 if not called_function:
                     logger.info(
-                        f"{node=} {type(node)} {self.file_path} {node.lineno} called but not a function call so ?"
+                        "node=%r %s %s %s called but not a function call so ?",
+                        node, type(node), self.file_path, node.lineno,
                     )
                     return
 
-                if not self.current_function_stack:
+                # Get the current calling function
+                caller_function = self.current_function
+                if not caller_function:
                     logger.info(
-                        f"{called_function=} called but no function stack, trying as import call"
+                        "called_function=%r called but no function stack, trying as import call",
+                        called_function,
                     )
                     self.try_as_import_call(node, called_function, None)
                     return
 
                 # TODO have I only considered once half of the call relationship for imports?
 
-                # Get the current calling function
-                caller_function = self.current_function_stack[-1]
+                depth = self.current_depth
+                symbols = self.symbols
 
                 # Use O(1) lookup instead of O(n) iteration
                 # First try exact match
-                if called_function in self.symbol_lookup:
-                    symbol_id = self.symbol_lookup[called_function]
-                    symbol_info = self.symbols[symbol_id]
-                    if symbol_info.type in ["function", "method"]:
-                        symbol_info.stack_levels.add(len(self.current_function_stack))
-                        if caller_function not in symbol_info.called_by:
-                            symbol_info.called_by.append(caller_function)
-
-                            return
+                symbol_id = self.symbol_lookup.get(called_function)
+                if symbol_id is not None:
+                    symbol_info = symbols[symbol_id]
+                    if symbol_info.type in ("function", "method"):
+                        symbol_info.stack_levels.add(depth)
+                        symbol_info.add_caller(caller_function)
+                        return
 
                 # Try method name match for any class
-                for name, symbol_id in self.symbol_lookup.items():
-                    if not name.endswith(f".{called_function}"):
-                        continue
-                    symbol_info = self.symbols[symbol_id]
-                    if symbol_info.type not in ["function", "method"]:
-                        continue
-                    symbol_info.stack_levels.add(len(self.current_function_stack))
-                    if caller_function not in symbol_info.called_by:
-                        symbol_info.called_by.append(caller_function)
+                symbol_id = self.method_lookup.get(called_function)
+                if symbol_id is not None:
+                    symbol_info = symbols[symbol_id]
+                    symbol_info.stack_levels.add(depth)
+                    symbol_info.add_caller(caller_function)
 
                     return  # TODO check this
 
@@ -396,6 +710,9 @@ class SinglePassVisitor(ast.NodeVisitor):
     def try_as_import_call(self, node, called_function, caller_function):
         if not self.explore_imports:
             return
+        # Nothing has been imported (yet), so the call cannot resolve to an import
+        if not self.imports:
+            return
         # If import ... then must be a module
         # If from ... import then can be module, var, class, func
         # If maybe chance of not module, then should try removing the last . split
@@ -406,9 +723,8 @@ class SinglePassVisitor(ast.NodeVisitor):
             import_symbol_id = import_call_info.called_symbol_id
             import_symbol_info = import_call_info.called_symbol_info
             if caller_function:
-                import_symbol_info.stack_levels.add(len(self.current_function_stack))
-            if caller_function not in import_symbol_info.called_by:
-                import_symbol_info.called_by.append(caller_function)
+                import_symbol_info.stack_levels.add(self.current_depth)
+            import_symbol_info.add_caller(caller_function)
 
             return
 
@@ -418,7 +734,8 @@ class SinglePassVisitor(ast.NodeVisitor):
         # Was called in this file but no import matches - should have been a direct match
         if caller_function and not matching_imports:
             logger.debug(
-                f"{called_function} was called by {caller_function} but no matching import found - Suggests called should be within the file."
+                "%s was called by %s but no matching import found - Suggests called should be within the file.",
+                called_function, caller_function,
             )
             return
 
@@ -429,22 +746,26 @@ class SinglePassVisitor(ast.NodeVisitor):
             pass
 
         import_specs = self.try_get_import_spec(matching_imports)
-        logger.debug(
-            "After trying as import call:\n"
-            f"{self.imports=}\n"
-            f"{called_function=}\n"
-            f"{node=}\n"
-            f"{matching_imports=}\n"
-            f"{import_specs=}\n"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "After trying as import call:\n"
+                f"{self.imports=}\n"
+                f"{called_function=}\n"
+                f"{node=}\n"
+                f"{matching_imports=}\n"
+                f"{import_specs=}\n"
+            )
         if not import_specs:
             return
 
         import_spec = import_specs[matching_imports[0]]
-        if import_spec.spec.origin:
-            relative_path = os.path.relpath(import_spec.spec.origin, self.project_dir)
-        else:
-            relative_path = os.path.relpath(self.file_path, self.project_dir)
+        origin = import_spec.spec.origin
+        # Without an origin, fall back to this file's own path
+        path = origin or self.file_path
+        if path not in self._relative_paths:
+            self._relative_paths[path] = os.path.relpath(path, self.project_dir)
+        relative_path = self._relative_paths[path]
+        if not origin:
             logger.warning(
                 f"import_spec for {called_function=} has no origin {import_spec.spec.name=} so using {relative_path=}\n"
                 "After trying as import call containers have values:\n"
@@ -466,16 +787,15 @@ class SinglePassVisitor(ast.NodeVisitor):
             import_symbol_id,
         )
 
-        logger.info(f"Derived import call: {relative_path=}\n{import_symbol_id=}\n{import_call_info=}")
-
-    def get_matching_imports(self, called_function):
-        terms = (called_function,)
-        if "." in called_function:
-            # terms = (called_function, called_function.split(".")[-1])
-            terms = (called_function, "." + called_function.split(".")[-1])
+        logger.info(
+            "Derived import call: relative_path=%r\nimport_symbol_id=%r\nimport_call_info=%r",
+            relative_path, import_symbol_id, import_call_info,
+        )
 
-        matching_imports = [i for i in self.imports if i.endswith(terms)]
-        return matching_imports
+    def get_matching_imports(self, called_function) -> Sequence[str]:
+        """Imports whose last dotted segment is the called name, in import order; do not mutate."""
+        # Call names come from Name.id or Attribute.attr, so they never contain a "."
+        return self._imports_by_last_segment.get(called_function, ())
 
     def call_info_from_import(
         self,
@@ -489,11 +809,8 @@ class SinglePassVisitor(ast.NodeVisitor):
         # Placeholder for another file
         if import_symbol_info := self.import_symbols.get(import_symbol_id, None):
             if caller_function:
-                import_symbol_info.stack_levels.add(len(self.current_function_stack))
-            if caller_function and (
-                caller_function not in import_symbol_info.called_by
-            ):
-                import_symbol_info.called_by.append(caller_function)
+                import_symbol_info.stack_levels.add(self.current_depth)
+                import_symbol_info.add_caller(caller_function)
                 # self.import_symbol_lookup[caller_function] = import_symbol_id
         else:
             import_symbol_info = SymbolInfo(
@@ -504,7 +821,7 @@ class SinglePassVisitor(ast.NodeVisitor):
                 called_by=[caller_function] if caller_function else [],
             )
             if caller_function:
-                import_symbol_info.stack_levels.add(len(self.current_function_stack))
+                import_symbol_info.stack_levels.add(self.current_depth)
             self.import_symbols[import_symbol_id] = import_symbol_info
             # self.import_symbol_lookup[caller_function] = import_symbol_id
 
@@ -519,65 +836,101 @@ class SinglePassVisitor(ast.NodeVisitor):
             self.import_call_info_lookup[called_function] = import_call_info
         return import_call_info
 
-    def try_get_import_spec(self, matching_imports: List[str]) -> Dict[str, ModuleSpec]:
-        return {
-            called_import: spec  # USE i instead for lookup
-            # spec.name: spec # USE i instead for lookup
-            for called_import in matching_imports
-            if (
-                spec := (
-                    ImportCallInfo.get_import_spec(
-                        called_import,
-                        self.project_dir,
-                        self.project_dir,
-                        self._from_imports.get(called_import, (None, None))[0],
-                        venv_root=self.venv_root,
-                    )
+    def try_get_import_spec(self, matching_imports: Sequence[str]) -> Dict[str, ModuleSpec]:
+        """Resolve specs for the matching imports, resolving each import at most once per file."""
+        import_specs = {}
+        for called_import in matching_imports:
+            if called_import not in self._import_specs:
+                self._import_specs[called_import] = _resolve_spec(
+                    called_import,
+                    self.project_dir,
+                    self._from_imports.get(called_import, (None, None))[0],
+                    self.venv_root,
                 )  # TODO This need to use self._imports ? Bug?
-            )
-            is not None
-        }
+            if (spec := self._import_specs[called_import]) is not None:
+                import_specs[called_import] = spec
+        return import_specs
 
     def _create_symbol_id(self, file_path: str, symbol_name: str) -> str:
-        """Create a unique symbol ID using normalizer if available."""
+        """Create a unique symbol ID using normalizer if available.
+
+        IDs are interned as they are used as dict keys and repeated in called_by lists.
+        """
         if self.normalizer:
-            return self.normalizer.create_symbol_id(file_path, symbol_name)
+            return sys.intern(self.normalizer.create_symbol_id(file_path, symbol_name))
         # Fallback to old behavior if normalizer not provided
-        return f"{file_path}::{symbol_name}"
+        return sys.intern(f"{file_path}::{symbol_name}")
 
     def _extract_function_signature(self, node: ast.FunctionDef) -> str:
         """Extract function signature from AST node."""
-        # Build basic signature
-        args = []
+        args = node.args
 
-        # Regular arguments
-        for arg in node.args.args:
-            args.append(arg.arg)
+        # Positional-only and regular arguments
+        parts = [arg.arg for arg in args.posonlyargs]
+        if parts:
+            parts.append("/")
+        parts += [arg.arg for arg in args.args]
 
-        # Varargs (*args)
-        if node.args.vararg:
-            args.append(f"*{node.args.vararg.arg}")
+        # Varargs (*args), or a bare * ahead of keyword-only arguments
+        if args.vararg:
+            parts.append("*" + args.vararg.arg)
+        elif args.kwonlyargs:
+            parts.append("*")
+        parts += [arg.arg for arg in args.kwonlyargs]
 
         # Keyword arguments (**kwargs)
-        if node.args.kwarg:
-            args.append(f"**{node.args.kwarg.arg}")
+        if args.kwarg:
+            parts.append("**" + args.kwarg.arg)
 
-        signature = f"def {node.name}({', '.join(args)}):"
-        return signature
+        return "".join(("def ", node.name, "(", ", ".join(parts), "):"))
 
 
+    @staticmethod
+    def _docstring_span(node) -> Optional[Tuple[int, int, int, int]]:
+        """Locate the docstring literal of a class or function without copying its text."""
+        if not node.body:
+            return None
+        first = node.body[0]
+        if type(first) is not ast.Expr:
+            return None
+        value = first.value
+        if type(value) is not ast.Constant or not isinstance(value.value, str):
+            return None
+        return (value.lineno, value.col_offset, value.end_lineno, value.end_col_offset)
+
     def try_get_func_name_from_expr(self, node: ast.expr):
-        if isinstance(node, ast.Call):
+        if type(node) is ast.Call:
             func = node.func
         else:
             func = node
-        if isinstance(func, ast.Name):
+        func_type = type(func)
+        if func_type is ast.Name:
             # Direct function call: function_name()
             called_function = func.id
-        elif isinstance(func, ast.Attribute):
+        elif func_type is ast.Attribute:
             # Method call: obj.method() or module.function()
             called_function = func.attr
         else:
             called_function = str(id(func))  # Fallback
-            self._no_func_name_nodes.append(node)
+            self._no_func_name_nodes.append(
+                (getattr(node, "lineno", -1), getattr(node, "col_offset", -1), type(node).__name__)
+            )
         return called_function
+
+
+# Nodes that can never contain a call or definition, so the walk doesn't push them at all.
+# Their only children, if any, are expression contexts or operator singletons.
+_LEAF_NODE_TYPES = frozenset(
+    {ast.Name, ast.Constant, ast.alias, ast.Pass, ast.Break, ast.Continue, ast.Global, ast.Nonlocal}
+    | {cls for base in (ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop) for cls in base.__subclasses__()}
+)
+
+# Node type -> unbound visit method, so dispatch needs no per-node string building or getattr.
+# Kept at module level rather than on the visitor to avoid bound-method reference cycles.
+_VISITORS = {
+    ast.ClassDef: SinglePassVisitor.visit_ClassDef,
+    ast.FunctionDef: SinglePassVisitor.visit_FunctionDef,
+    ast.Import: SinglePassVisitor.visit_Import,
+    ast.ImportFrom: SinglePassVisitor.visit_ImportFrom,
+    ast.Call: SinglePassVisitor.visit_Call,
+}
@@ -12,11 +12,30 @@ import re
 
 from .neo4j_index_manager import Neo4jIndexManager, Neo4jIndexProvider
 
-# Disable logging for tests
-logging.disable(logging.CRITICAL)
 
+class _QuietTestCase(unittest.TestCase):
+    """Test case that disables logging while its class runs."""
 
-class TestGlobToRegex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable logging for these tests only, restoring the previous level afterwards."""
+        super().setUpClass()
+        cls._previous_logging_disable = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the logging level in effect before the class ran."""
+        logging.disable(cls._previous_logging_disable)
+        super().tearDownClass()
+
+
+# File paths returned by the fake index
+ALL_FILES = ("file1.py", "file2.py", "src/file3.js")
+PY_FILES = ("file1.py", "file2.py")
+
+
+class TestGlobToRegex(_QuietTestCase):
     """Test cases for _glob_to_regex helper method."""
 
     def setUp(self):
@@ -36,13 +55,14 @@ class TestGlobToRegex(unittest.TestCase):
         ]
         
         for glob_pattern, expected_regex in test_cases:
-            result = self.provider._glob_to_regex(glob_pattern)
-            self.assertEqual(expected_regex, result)
-            # Verify the regex is valid
-            try:
-                re.compile(result)
-            except re.error:
-                self.fail(f"Invalid regex pattern: {result}")
+            with self.subTest(glob=glob_pattern):
+                result = self.provider._glob_to_regex(glob_pattern)
+                self.assertEqual(expected_regex, result)
+                # Verify the regex is valid
+                try:
+                    re.compile(result)
+                except re.error:
+                    self.fail(f"Invalid regex pattern: {result}")
 
     def test_complex_glob_patterns(self):
         """Test complex glob pattern conversion."""
@@ -55,12 +75,13 @@ class TestGlobToRegex(unittest.TestCase):
         ]
         
         for glob_pattern in test_patterns:
-            result = self.provider._glob_to_regex(glob_pattern)
-            # Just verify the regex is valid
-            try:
-                re.compile(result)
-            except re.error:
-                self.fail(f"Invalid regex pattern: {result}")
+            with self.subTest(glob=glob_pattern):
+                result = self.provider._glob_to_regex(glob_pattern)
+                # Just verify the regex is valid
+                try:
+                    re.compile(result)
+                except re.error:
+                    self.fail(f"Invalid regex pattern: {result}")
 
     def test_special_characters(self):
         """Test glob patterns with special regex characters."""
@@ -73,15 +94,90 @@ class TestGlobToRegex(unittest.TestCase):
         ]
         
         for glob_pattern in test_patterns:
-            result = self.provider._glob_to_regex(glob_pattern)
-            # Just verify the regex is valid
-            try:
-                re.compile(result)
-            except re.error:
-                self.fail(f"Invalid regex pattern: {result}")
+            with self.subTest(glob=glob_pattern):
+                result = self.provider._glob_to_regex(glob_pattern)
+                # Just verify the regex is valid
+                try:
+                    re.compile(result)
+                except re.error:
+                    self.fail(f"Invalid regex pattern: {result}")
+
+
+class TestGlobToCypherPredicate(_QuietTestCase):
+    """Test cases for _glob_to_cypher_predicate helper method."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.provider = Neo4jIndexProvider(Mock(), "/test/project")
+
+    def test_predicates(self):
+        """Test literal prefixes and suffixes avoid the regex where possible."""
+        test_cases = [
+            ("*", ("", {})),
+            ("**", ("", {})),
+            ("src/file.py", ("WHERE f.path = $path", {"path": "src/file.py"})),
+            ("src/*", ("WHERE f.path STARTS WITH $prefix", {"prefix": "src/"})),
+            (
+                "src/*.py",
+                (
+                    "WHERE f.path STARTS WITH $prefix AND f.path ENDS WITH $suffix"
+                    " AND size(f.path) >= $min_length",
+                    {"prefix": "src/", "suffix": ".py", "min_length": 7},
+                ),
+            ),
+            (
+                "src/test_?.js",
+                (
+                    "WHERE f.path STARTS WITH $prefix AND f.path ENDS WITH $suffix"
+                    " AND f.path =~ $pattern",
+                    {"prefix": "src/test_", "suffix": ".js", "pattern": "^src/test_.\\.js$"},
+                ),
+            ),
+        ]
+
+        for glob_pattern, expected in test_cases:
+            with self.subTest(glob=glob_pattern):
+                self.assertEqual(expected, self.provider._glob_to_cypher_predicate(glob_pattern))
+
+    def test_predicates_agree_with_regex(self):
+        """Test each predicate selects the same paths as the glob's regex."""
+        paths = ["a.py", "src/a.py", "src/.py", "src/b/c.py", "src/test_1.js", "src/x.js", "aba", "abba"]
+        patterns = ["*", "*.py", "src/*", "src/*.py", "src/test_?.js", "ab*ba", "a*b*a", "[as]*"]
+
+        for glob_pattern in patterns:
+            with self.subTest(glob=glob_pattern):
+                where, params = self.provider._glob_to_cypher_predicate(glob_pattern)
+                expected = [p for p in paths if re.match(self.provider._glob_to_regex(glob_pattern), p)]
+                selected = [
+                    p for p in paths
+                    if p.startswith(params.get("prefix", ""))
+                    and p.endswith(params.get("suffix", ""))
+                    and len(p) >= params.get("min_length", 0)
+                    and re.match(params.get("pattern", ""), p)
+                    and params.get("path", p) == p
+                ]
+                self.assertEqual(expected, selected)
+
 
+class _FakeSession:
+    """Minimal stand-in for a Neo4j session that returns canned records."""
 
-class TestSearchFiles(unittest.TestCase):
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query, **params):
+        self.calls.append((query, params))
+        return self.records
+
+
+class TestSearchFiles(_QuietTestCase):
     """Test cases for search_files method in Neo4jIndexProvider."""
 
     def setUp(self):
@@ -89,73 +185,58 @@ class TestSearchFiles(unittest.TestCase):
         self.mock_driver = Mock()
         self.provider = Neo4jIndexProvider(self.mock_driver, "/test/project")
 
+    def _session(self, records):
+        """Have the driver hand out a fake session returning records."""
+        session = _FakeSession(records)
+        self.mock_driver.session.return_value = session
+        return session
+
     def test_search_files_all(self):
         """Test search_files with '*' pattern."""
-        # Create a list to store the expected file paths
-        expected_files = ["file1.py", "file2.py", "src/file3.js"]
-        
-        # Create a mock session
-        mock_session = Mock()
-        
-        # Create a list of mock records
-        mock_records = []
-        for file_path in expected_files:
-            mock_record = {"path": file_path}
-            mock_records.append(mock_record)
-        
-        # Configure the session's run method to return the mock records
-        mock_session.run.return_value = mock_records
-        
-        # Configure the driver's session method to return the mock session as a context manager
-        self.mock_driver.session.return_value = mock_session
-        # Make the mock session act like a context manager
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
-        
+        # Setup
+        session = self._session([{"path": file_path} for file_path in ALL_FILES])
+
         # Execute
         result = self.provider.search_files("*")
-        
+
         # Verify
-        self.assertEqual(expected_files, result)
-        mock_session.run.assert_called_once()
-        # Verify the query uses the regex pattern
-        args, kwargs = mock_session.run.call_args
-        self.assertIn("=~", args[0])  # Cypher regex operator
-        self.assertEqual("^.*$", kwargs["pattern"])  # Regex pattern
+        self.assertEqual(list(ALL_FILES), result)
+        self.assertEqual(1, len(session.calls))
+        # Verify the query skips the regex when every file matches
+        query, params = session.calls[0]
+        self.assertNotIn("=~", query)
+        self.assertEqual({}, params)
 
     def test_search_files_pattern(self):
         """Test search_files with specific pattern."""
-        # Create a list to store the expected file paths
-        expected_files = ["file1.py", "file2.py"]
-        
-        # Create a mock session
-        mock_session = Mock()
-        
-        # Create a list of mock records
-        mock_records = []
-        for file_path in expected_files:
-            mock_record = {"path": file_path}
-            mock_records.append(mock_record)
-        
-        # Configure the session's run method to return the mock records
-        mock_session.run.return_value = mock_records
-        
-        # Configure the driver's session method to return the mock session as a context manager
-        self.mock_driver.session.return_value = mock_session
-        # Make the mock session act like a context manager
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
-        
+        # Setup
+        session = self._session([{"path": file_path} for file_path in PY_FILES])
+
         # Execute
         result = self.provider.search_files("*.py")
-        
+
+        # Verify
+        self.assertEqual(list(PY_FILES), result)
+        self.assertEqual(1, len(session.calls))
+        # Verify the literal suffix is matched without a regex
+        query, params = session.calls[0]
+        self.assertIn("ENDS WITH", query)
+        self.assertNotIn("=~", query)
+        self.assertEqual({"suffix": ".py"}, params)
+
+    def test_search_files_literal_path(self):
+        """Test search_files matches a wildcard-free pattern by equality."""
+        # Setup
+        session = self._session([{"path": "src/file3.js"}])
+
+        # Execute
+        result = self.provider.search_files("src/file3.js")
+
         # Verify
-        self.assertEqual(expected_files, result)
-        mock_session.run.assert_called_once()
-        # Verify the query uses the regex pattern
-        args, kwargs = mock_session.run.call_args
-        self.assertIn("=~", args[0])  # Cypher regex operator
-        self.assertEqual("^.*\\.py$", kwargs["pattern"])  # Regex pattern
+        self.assertEqual(["src/file3.js"], result)
+        query, params = session.calls[0]
+        self.assertNotIn("=~", query)
+        self.assertEqual({"path": "src/file3.js"}, params)
 
     def test_search_files_error(self):
         """Test search_files error handling."""
@@ -169,7 +250,7 @@ class TestSearchFiles(unittest.TestCase):
         self.assertEqual([], result)  # Should return empty list on error
 
 
-class TestFindFiles(unittest.TestCase):
+class TestFindFiles(_QuietTestCase):
     """Test cases for find_files method in Neo4jIndexManager."""
 
     def setUp(self):
@@ -182,13 +263,13 @@ class TestFindFiles(unittest.TestCase):
     def test_find_files_with_provider(self):
         """Test find_files when index_provider is initialized."""
         # Setup mock
-        self.mock_provider.search_files.return_value = ["file1.py", "file2.py"]
+        self.mock_provider.search_files.return_value = list(PY_FILES)
         
         # Execute
         result = self.manager.find_files("*.py")
         
         # Verify
-        self.assertEqual(["file1.py", "file2.py"], result)
+        self.assertEqual(list(PY_FILES), result)
         self.mock_provider.search_files.assert_called_once_with("*.py")
 
     def test_find_files_no_provider(self):
@@ -205,13 +286,13 @@ class TestFindFiles(unittest.TestCase):
     def test_find_files_default_pattern(self):
         """Test find_files with default pattern."""
         # Setup mock
-        self.mock_provider.search_files.return_value = ["file1.py", "file2.py", "src/file3.js"]
+        self.mock_provider.search_files.return_value = list(ALL_FILES)
         
         # Execute
         result = self.manager.find_files()  # No pattern provided
         
         # Verify
-        self.assertEqual(["file1.py", "file2.py", "src/file3.js"], result)
+        self.assertEqual(list(ALL_FILES), result)
         self.mock_provider.search_files.assert_called_once_with("*")  # Default pattern
 
     def test_find_files_error_handling(self):
@@ -7,10 +7,11 @@ by building an index for a sample project and verifying the results.
 """
 
 import argparse
+import functools
 import logging
-import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from code_index_mcp.indexing.neo4j_index_manager import get_neo4j_index_manager
@@ -27,44 +28,59 @@ def test_cross_file_calls(provider):
     """Test cross-file call detection."""
     logger.info("Testing cross-file call detection...")
     
-    # Get cross-file calls
-    calls = provider.get_cross_file_calls(limit=10)
+    # Count cross-file calls, fetching only the ones displayed
+    call_count, calls = provider.get_cross_file_calls_summary(limit=3)
     
     if not calls:
         logger.warning("No cross-file calls detected. This is unusual for a real-world codebase.")
         return False
     
-    logger.info(f"Detected {len(calls)} cross-file calls")
-    for i, call in enumerate(calls[:3], 1):
-        logger.info(f"{i}. {call['caller_name']} -> {call['called_name']}")
-        logger.info(f"   Caller File: {call['caller_file']}")
-        logger.info(f"   Called File: {call['called_file']}")
+    if logger.isEnabledFor(logging.INFO):
+        lines = [f"Detected {call_count} cross-file calls"]
+        for i, call in enumerate(calls, 1):
+            lines.append(f"{i}. {call['caller_name']} -> {call['called_name']}")
+            lines.append(f"   Caller File: {call['caller_file']}")
+            lines.append(f"   Called File: {call['called_file']}")
+        logger.info("\n".join(lines))
     
     # Get functions with most cross-file calls
-    functions = provider.get_functions_with_most_cross_file_calls(limit=5)
+    functions = provider.get_functions_with_most_cross_file_calls(limit=2)
     
     outgoing = functions.get("outgoing", [])
     incoming = functions.get("incoming", [])
     
-    if outgoing:
-        logger.info(f"Functions with most outgoing cross-file calls: {len(outgoing)}")
-        for i, func in enumerate(outgoing[:2], 1):
-            logger.info(f"{i}. {func['name']} ({func['outgoing_cross_file_calls']} calls)")
-    
-    if incoming:
-        logger.info(f"Functions with most incoming cross-file calls: {len(incoming)}")
-        for i, func in enumerate(incoming[:2], 1):
-            logger.info(f"{i}. {func['name']} ({func['incoming_cross_file_calls']} calls)")
-    
-    return len(calls) > 0
+    if outgoing and logger.isEnabledFor(logging.INFO):
+        lines = [f"Functions with most outgoing cross-file calls: {len(outgoing)}"]
+        lines += [
+            f"{i}. {func['name']} ({func['outgoing_cross_file_calls']} calls)"
+            for i, func in enumerate(outgoing, 1)
+        ]
+        logger.info("\n".join(lines))
+    
+    if incoming and logger.isEnabledFor(logging.INFO):
+        lines = [f"Functions with most incoming cross-file calls: {len(incoming)}"]
+        lines += [
+            f"{i}. {func['name']} ({func['incoming_cross_file_calls']} calls)"
+            for i, func in enumerate(incoming, 1)
+        ]
+        logger.info("\n".join(lines))
+    
+    return call_count > 0
 
 
 def test_clustering(provider, k=5):
     """Test K-means clustering."""
     logger.info("Testing K-means clustering...")
     
+    # Share one session across the per-cluster queries
+    with provider.scoped_session() as session:
+        return _check_clusters(provider, session, k)
+
+
+def _check_clusters(provider, session, k):
+    """Log cluster statistics and the top functions of each cluster."""
     # Get cluster statistics
-    clusters = provider.get_cluster_statistics()
+    clusters = provider.get_cluster_statistics(session=session)
     
     if not clusters:
         logger.warning("No clusters detected.")
@@ -76,29 +92,43 @@ def test_clustering(provider, k=5):
     if len(clusters) != k:
         logger.warning(f"Expected {k} clusters, but got {len(clusters)}")
     
+    if not logger.isEnabledFor(logging.INFO):
+        return True
+    
     # Display cluster statistics
+    lines = []
     for cluster in clusters:
-        logger.info(f"Cluster {cluster['id']}: {cluster['count']} functions")
-        logger.info(f"  Avg Outgoing Calls: {cluster.get('avg_outgoing', 0):.2f}")
-        logger.info(f"  Avg Incoming Calls: {cluster.get('avg_incoming', 0):.2f}")
+        lines.append(f"Cluster {cluster['id']}: {cluster['count']} functions")
+        lines.append(f"  Avg Outgoing Calls: {cluster.get('avg_outgoing', 0):.2f}")
+        lines.append(f"  Avg Incoming Calls: {cluster.get('avg_incoming', 0):.2f}")
+    logger.info("\n".join(lines))
     
     # Get functions in each cluster
-    for cluster_id in range(len(clusters)):
-        functions = provider.get_functions_in_cluster(cluster_id, limit=5)
-        logger.info(f"Cluster {cluster_id}: {len(functions)} functions")
-        for i, func in enumerate(functions[:2], 1):
-            logger.info(f"  {i}. {func['name']} (in: {func.get('incoming_calls', 0)}, out: {func.get('outgoing_calls', 0)})")
+    lines = []
+    for cluster in clusters:
+        cluster_id = cluster["id"]
+        functions = provider.get_functions_in_cluster(cluster_id, limit=2, session=session)
+        lines.append(f"Cluster {cluster_id}: {cluster['count']} functions")
+        for i, func in enumerate(functions, 1):
+            lines.append(f"  {i}. {func['name']} (in: {func.get('incoming_calls', 0)}, out: {func.get('outgoing_calls', 0)})")
+    logger.info("\n".join(lines))
     
     return True
 
 
-def main():
-    """Main test function."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; it is reused on repeated in-process runs."""
     parser = argparse.ArgumentParser(description="Test Neo4j clustering and cross-file call detection")
     parser.add_argument("--project-path", required=True, help="Path to the project")
     parser.add_argument("--k", type=int, default=5, help="Number of clusters for K-means")
     parser.add_argument("--max-iterations", type=int, default=50, help="Maximum iterations for K-means")
     parser.add_argument("--skip-refresh", action="store_true", help="Skip index refresh")
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Refresh the index even if the project files and k are unchanged since it was built",
+    )
     
     # Neo4j connection options
     # neo4j_group = parser.add_argument_group("Neo4j Connection Options")
@@ -107,15 +137,14 @@ def main():
     parser.add_argument("--neo4j-password", default="password", help="Neo4j password")
     parser.add_argument("--neo4j-database", default="neo4j", help="Neo4j database name")
     parser.add_argument("--config-path", help="Path to Neo4j configuration file", default=None)
+    return parser
+
+
+def main():
+    """Main test function."""
+    args = _build_parser().parse_args()
     
-    args = parser.parse_args()
-    
-    # Validate project path
     project_path = args.project_path
-    if not os.path.isdir(project_path):
-        logger.error(f"Project path does not exist: {project_path}")
-        sys.exit(1)
-    
     logger.info(f"Testing with project: {project_path}")
     
     # Initialize Neo4j index manager
@@ -125,7 +154,9 @@ def main():
     if args.config_path:
         manager.config_path = args.config_path
         
-    manager.set_project_path(project_path)
+    # Validates the project path; initialization waits for the connection config below
+    if not manager.set_project_path(project_path, init=False):
+        sys.exit(1)
     
     # Set Neo4j connection configuration
     manager.set_neo4j_config(
@@ -144,7 +175,13 @@ def main():
     logger.info(f"Configured clustering with k={args.k}, max_iterations={args.max_iterations}")
     
     # Refresh index if needed
-    if not args.skip_refresh:
+    refresh = not args.skip_refresh
+    if refresh and not args.force_refresh and manager.is_index_current():
+        clustering = manager.get_index_status().get("clustering", {})
+        if clustering.get("k") == args.k:
+            logger.info(f"Index for {project_path} is up to date, skipping refresh")
+            refresh = False
+    if refresh:
         logger.info(f"Refreshing index for {project_path}...")
         start_time = time.time()
         success = manager.refresh_index()
@@ -173,11 +210,13 @@ def main():
         clustering = status["clustering"]
         logger.info(f"Clustering: k={clustering['k']}, timestamp={clustering['timestamp']}")
     
-    # Test cross-file call detection
-    cross_file_success = test_cross_file_calls(provider)
-    
-    # Test clustering
-    clustering_success = test_clustering(provider, args.k)
+    # Test cross-file call detection and clustering concurrently; they query
+    # independent parts of the graph and the driver is shared across threads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cross_file_future = executor.submit(test_cross_file_calls, provider)
+        clustering_future = executor.submit(test_clustering, provider, args.k)
+        cross_file_success = cross_file_future.result()
+        clustering_success = clustering_future.result()
     
     # Report results
     logger.info("\nTest Results:")
@@ -6,6 +6,7 @@ to create and query a Neo4j-based code index.
 """
 
 import argparse
+import functools
 import logging
 import os
 import sys
@@ -79,8 +80,8 @@ def test_neo4j_index(args: Dict[str, Any]) -> int:
             neo4j_database
         )
         
-        # Set project path
-        if not neo4j_manager.set_project_path(project_path):
+        # Set project path, initializing once below rather than here as well
+        if not neo4j_manager.set_project_path(project_path, init=False):
             logger.error("Failed to set project path")
             return 1
         
@@ -108,29 +109,37 @@ def test_neo4j_index(args: Dict[str, Any]) -> int:
             logger.error("Failed to get Neo4j index provider")
             return 1
         
-        # Get file list
-        files = provider.get_file_list()
-        logger.info(f"Found {len(files)} files in Neo4j index")
+        # Get file count and samples of files and symbols in one round trip
+        overview = provider.get_overview(sample_file_limit=5, sample_symbol_limit=5)
+        files = overview["files"]
+        logger.info(f"Found {overview['file_count']} files in Neo4j index")
         
         # Show some files
-        for i, file in enumerate(files[:5]):
-            logger.info(f"File {i+1}: {file.file_path} ({file.language}, {file.line_count} lines)")
+        if files:
+            logger.info("\n".join(
+                f"File {i+1}: {file.file_path} ({file.language}, {file.line_count} lines)"
+                for i, file in enumerate(files)
+            ))
         
-        # Get symbols for a file
+        # Show symbols for a file
         if files:
             file_path = files[0].file_path
-            symbols = provider.query_symbols(file_path)
-            logger.info(f"Found {len(symbols)} symbols in file {file_path}")
+            logger.info(f"Found {overview['symbol_count']} symbols in file {file_path}")
             
             # Show some symbols
-            for i, symbol in enumerate(symbols[:5]):
-                logger.info(f"Symbol {i+1}: {symbol.type} at line {symbol.line}")
-        
-        # Test using the factory
+            if overview["symbols"]:
+                logger.info("\n".join(
+                    f"Symbol {i+1}: {symbol.type} at line {symbol.line}"
+                    for i, symbol in enumerate(overview["symbols"])
+                ))
+        
+        # Test using the factory; it hands out the same global manager, which is
+        # already initialized, so it is not connected again
         logger.info("Testing index factory...")
         factory_manager = get_index_manager(NEO4J_INDEX_TYPE)
-        factory_manager.set_project_path(project_path)
-        factory_manager.initialize()
+        if factory_manager is not neo4j_manager:
+            logger.error("Index factory did not return the global Neo4j index manager")
+            return 1
         
         factory_status = factory_manager.get_index_status()
         logger.info(f"Factory Neo4j index status: {factory_status}")
@@ -143,8 +152,9 @@ def test_neo4j_index(args: Dict[str, Any]) -> int:
         return 1
 
 
-def main():
-    """Main entry point for the test script."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; it is reused on repeated in-process runs."""
     parser = argparse.ArgumentParser(description="Test Neo4j index builder and manager")
     parser.add_argument("--project-path", required=True, help="Path to the project")
     parser.add_argument("--neo4j-uri", default="bolt://localhost:7687", help="Neo4j URI")
@@ -152,8 +162,12 @@ def main():
     parser.add_argument("--neo4j-password", default="password", help="Neo4j password")
     parser.add_argument("--neo4j-database", default="neo4j", help="Neo4j database name")
     parser.add_argument("--migrate", action="store_true", help="Migrate from JSON index")
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point for the test script."""
+    args = _build_parser().parse_args()
     
     # Convert args to dictionary
     args_dict = vars(args)
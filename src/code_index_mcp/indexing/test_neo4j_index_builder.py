@@ -0,0 +1,185 @@
+"""
+Unit tests for Neo4jIndexBuilder.
+
+This module contains unit tests for the Neo4jIndexBuilder class, using a
+temporary project and a driver that records the Cypher it is sent instead
+of talking to Neo4j.
+"""
+
+import os
+import tempfile
+import unittest
+import logging
+from unittest.mock import MagicMock, patch
+
+from .neo4j_index_builder import MIN_PARALLEL_PARSE_FILES, Neo4jIndexBuilder
+from .strategies.python_strategy import PythonParsingStrategy
+
+
+class _RecordingDriver:
+    """Minimal stand-in for a Neo4j driver whose sessions record every query."""
+
+    def __init__(self):
+        self.runs = []
+
+    def session(self, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query, parameters=None, **kwargs):
+        self.runs.append((query, parameters if parameters is not None else kwargs))
+        return MagicMock()
+
+
+class _Neo4jBuilderTestBase(unittest.TestCase):
+    """Shared fixtures for tests that build from a temporary project."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Disable logging for these tests only."""
+        cls._previous_logging_disable = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the logging level in effect before the class ran."""
+        logging.disable(cls._previous_logging_disable)
+
+    def setUp(self):
+        """Set up a temporary project directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.project_path = temp_dir.name
+
+    def _write(self, rel_path: str, content: str) -> str:
+        """Write a project file and return its path."""
+        file_path = os.path.join(self.project_path, rel_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return file_path
+
+    def _builder(self, **kwargs) -> Neo4jIndexBuilder:
+        """Create a builder for the temporary project on a recording driver."""
+        return Neo4jIndexBuilder(
+            self.project_path, "bolt://test", "neo4j", "password", driver=_RecordingDriver(), **kwargs
+        )
+
+
+class TestNeo4jIndexBuilderFingerprint(_Neo4jBuilderTestBase):
+    """Test cases for the fingerprint that decides whether a stored index is current."""
+
+    def setUp(self):
+        """Set up a project with one file and a venv beside it."""
+        super().setUp()
+        self.module_path = self._write("module.py", "def first():\n    pass\n")
+        venv_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(venv_dir.cleanup)
+        self.venv_path = venv_dir.name
+        self.site_packages = os.path.join(self.venv_path, "lib", "python3.12", "site-packages")
+        os.makedirs(self.site_packages)
+        self.builder = self._builder(venv_path=self.venv_path)
+        self.fingerprint = self.builder.compute_fingerprint()
+
+    def test_unchanged_project_keeps_fingerprint(self):
+        """Test the fingerprint is stable while nothing changes."""
+        self.assertEqual(self.fingerprint, self.builder.compute_fingerprint())
+
+    def test_edited_file_changes_fingerprint(self):
+        """Test editing a file changes the fingerprint."""
+        # Setup
+        stat = os.stat(self.module_path)
+        self._write("module.py", "def first():\n    return 1\n")
+        os.utime(self.module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Execute
+        fingerprint = self.builder.compute_fingerprint()
+
+        # Verify
+        self.assertNotEqual(self.fingerprint, fingerprint)
+
+    def test_added_file_changes_fingerprint(self):
+        """Test adding a file changes the fingerprint."""
+        # Setup
+        self._write("other.py", "def second():\n    pass\n")
+
+        # Execute
+        fingerprint = self.builder.compute_fingerprint()
+
+        # Verify
+        self.assertNotEqual(self.fingerprint, fingerprint)
+
+    def test_index_version_changes_fingerprint(self):
+        """Test a new index format makes existing indexes stale."""
+        # Execute
+        with patch(f"{Neo4jIndexBuilder.__module__}.INDEX_VERSION", "0.0.0-test"):
+            fingerprint = self.builder.compute_fingerprint()
+
+        # Verify
+        self.assertNotEqual(self.fingerprint, fingerprint)
+
+    def test_site_packages_change_changes_fingerprint(self):
+        """Test installing or removing venv packages changes the fingerprint."""
+        # Setup
+        stat = os.stat(self.site_packages)
+        os.utime(self.site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        # Execute
+        fingerprint = self.builder.compute_fingerprint()
+
+        # Verify
+        self.assertNotEqual(self.fingerprint, fingerprint)
+
+
+class TestNeo4jIndexBuilderParallelParsing(_Neo4jBuilderTestBase):
+    """Test cases for parsing Python files in worker processes."""
+
+    def _stored(self, parse_workers):
+        """Build the index and return the File and Symbol properties sent to Neo4j."""
+        builder = self._builder(parse_workers=parse_workers)
+
+        # Execute
+        self.assertTrue(builder.build_index(run_clustering=False))
+
+        return [
+            params for query, params in builder.driver.runs
+            if "SET f.line_count" in query or "SET s.name" in query
+        ]
+
+    def test_worker_processes_store_same_symbols(self):
+        """Test parsing in worker processes stores the same symbols and docstrings as in-process."""
+        # Setup
+        for index in range(MIN_PARALLEL_PARSE_FILES + 8):
+            self._write(
+                f"pkg/module_{index}.py",
+                f'def helper_{index}():\n'
+                f'    """Help number {index}."""\n'
+                f'    return {index}\n'
+                f'\n'
+                f'class Worker{index}:\n'
+                f'    """Worker number {index}."""\n'
+                f'    def run(self, value, /, *, scale=1):\n'
+                f'        return helper_{index}() * scale\n',
+            )
+
+        # Execute
+        in_process = self._stored(parse_workers=None)
+        with patch.object(
+            PythonParsingStrategy, "parse_many", wraps=PythonParsingStrategy.parse_many
+        ) as parse_many:
+            in_workers = self._stored(parse_workers=2)
+
+        # Verify
+        parse_many.assert_called_once()
+        self.assertEqual(in_process, in_workers)
+        docstrings = {params["docstring"] for params in in_workers if "docstring" in params}
+        self.assertIn("Worker number 0.", docstrings)
+
+
+if __name__ == "__main__":
+    unittest.main()
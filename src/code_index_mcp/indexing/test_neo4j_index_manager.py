@@ -5,6 +5,9 @@ This module contains unit tests for the Neo4jIndexManager class,
 focusing on testing individual methods with proper mocking.
 """
 
+import copy
+import threading
+import types
 import unittest
 from unittest.mock import Mock, patch
 import logging
@@ -12,24 +15,83 @@ from typing import Dict, Any
 
 from .neo4j_index_manager import Neo4jIndexManager
 
-# Disable logging for tests
-logging.disable(logging.CRITICAL)
 
+# get_index_status results, and the full get_index_stats result for an available index
+_STATUS_AVAILABLE = {
+    "status": "available",
+    "project_path": "/test/path",
+    "file_count": 100,
+    "symbol_count": 500,
+    "class_count": 50,
+    "function_count": 200,
+    "languages": ["python", "javascript"],
+    "index_version": "1.0",
+    "timestamp": "2023-01-01T00:00:00"
+}
+_EXPECTED_LOADED = {
+    "status": "loaded",
+    "project_path": "/test/path",
+    "indexed_files": 100,
+    "total_symbols": 500,
+    "symbol_types": {
+        "class": 50,
+        "function": 200
+    },
+    "languages": ["python", "javascript"],
+    "index_version": "1.0",
+    "timestamp": "2023-01-01T00:00:00"
+}
+_STATUS_EMPTY = {
+    "status": "empty",
+    "project_path": "/test/path",
+    "file_count": 0,
+    "symbol_count": 0,
+    "class_count": 0,
+    "function_count": 0,
+    "languages": [],
+    "index_version": "unknown",
+    "timestamp": "unknown"
+}
 
-class TestNeo4jIndexManager(unittest.TestCase):
+
+class _Neo4jManagerTestBase(unittest.TestCase):
+    """Shared fixtures for tests that drive a Neo4jIndexManager."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the manager each test starts from."""
+        # Disable logging for these tests only, restoring the previous level afterwards
+        cls._previous_logging_disable = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+        cls._template_manager = Neo4jIndexManager()
+        cls._template_manager.project_path = "/test/project"
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the logging level in effect before the class ran."""
+        logging.disable(cls._previous_logging_disable)
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Tests only rebind attributes, so a shallow copy is as good as a new manager
+        self.manager = copy.copy(self._template_manager)
+        # The lock is the one piece of mutable state a copy would otherwise share
+        self.manager._lock = threading.RLock()
+
+
+class TestNeo4jIndexManager(_Neo4jManagerTestBase):
     """Test cases for Neo4jIndexManager class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.manager = Neo4jIndexManager()
-        self.manager.project_path = "/test/project"
-        # Create a mock driver
-        self.mock_driver = Mock()
+        super().setUp()
+        # Only the driver's presence is checked, so no call recording is needed
+        self.mock_driver = types.SimpleNamespace()
         self.manager.driver = self.mock_driver
-
-    def tearDown(self):
-        """Tear down test fixtures."""
-        self.manager.cleanup()
+        # Project paths are checked with os.path.isdir; tests adjust the result as needed
+        isdir_patcher = patch('os.path.isdir', return_value=True)
+        self.mock_isdir = isdir_patcher.start()
+        self.addCleanup(isdir_patcher.stop)
 
     def test_get_index_stats_driver_not_initialized(self):
         """Test get_index_stats when driver is not initialized."""
@@ -43,76 +105,28 @@ class TestNeo4jIndexManager(unittest.TestCase):
         self.assertEqual({"status": "not_loaded"}, result)
 
     def test_get_index_stats_index_available(self):
-        """Test get_index_stats when index is available."""
+        """Test get_index_stats maps every get_index_status field when index is available."""
         # Setup
-        # Mock get_index_status
-        status_data = {
-            "status": "available",
-            "project_path": "/test/path",
-            "file_count": 100,
-            "symbol_count": 500,
-            "class_count": 50,
-            "function_count": 200,
-            "languages": ["python", "javascript"],
-            "index_version": "1.0",
-            "timestamp": "2023-01-01T00:00:00"
-        }
-        self.manager.get_index_status = Mock(return_value=status_data)
+        self.manager.get_index_status = Mock(return_value=_STATUS_AVAILABLE)
         
         # Execute
         result = self.manager.get_index_stats()
         
         # Verify
-        expected = {
-            "status": "loaded",
-            "project_path": "/test/path",
-            "indexed_files": 100,
-            "total_symbols": 500,
-            "symbol_types": {
-                "class": 50,
-                "function": 200
-            },
-            "languages": ["python", "javascript"],
-            "index_version": "1.0",
-            "timestamp": "2023-01-01T00:00:00"
-        }
-        self.assertEqual(expected, result)
+        self.assertEqual(_EXPECTED_LOADED, result)
 
     def test_get_index_stats_index_not_available(self):
         """Test get_index_stats when index is not available."""
         # Setup
-        # Mock get_index_status
-        status_data = {
-            "status": "empty",
-            "project_path": "/test/path",
-            "file_count": 0,
-            "symbol_count": 0,
-            "class_count": 0,
-            "function_count": 0,
-            "languages": [],
-            "index_version": "unknown",
-            "timestamp": "unknown"
-        }
-        self.manager.get_index_status = Mock(return_value=status_data)
+        self.manager.get_index_status = Mock(return_value=_STATUS_EMPTY)
         
         # Execute
         result = self.manager.get_index_stats()
         
         # Verify
-        expected = {
-            "status": "not_loaded",
-            "project_path": "/test/path",
-            "indexed_files": 0,
-            "total_symbols": 0,
-            "symbol_types": {
-                "class": 0,
-                "function": 0
-            },
-            "languages": [],
-            "index_version": "unknown",
-            "timestamp": "unknown"
-        }
-        self.assertEqual(expected, result)
+        self.assertEqual("not_loaded", result["status"])
+        self.assertEqual(0, result["indexed_files"])
+        self.assertEqual({"class": 0, "function": 0}, result["symbol_types"])
 
     def test_get_index_stats_exception_handling(self):
         """Test get_index_stats exception handling."""
@@ -238,12 +252,40 @@ class TestNeo4jIndexManager(unittest.TestCase):
             k=5  # Default value
         )
     
+    def test_build_index_skips_current_index(self):
+        """Test build_index leaves an index built from the current files alone."""
+        # Setup
+        mock_builder = Mock()
+        self.manager.index_builder = mock_builder
+
+        # Execute
+        with patch.object(self.manager, 'is_index_current', return_value=True):
+            result = self.manager.build_index()
+
+        # Verify
+        self.assertTrue(result)
+        mock_builder.build_index.assert_not_called()
+
+    def test_build_index_force_rebuild(self):
+        """Test build_index with force_rebuild rebuilds even a current index."""
+        # Setup
+        mock_builder = Mock()
+        mock_builder.build_index.return_value = True
+        self.manager.index_builder = mock_builder
+
+        # Execute
+        with patch.object(self.manager, 'is_index_current', return_value=True), \
+                patch.object(self.manager, 'save_index', return_value=True):
+            result = self.manager.build_index(force_rebuild=True)
+
+        # Verify
+        self.assertTrue(result)
+        mock_builder.build_index.assert_called_once()
+
     def test_set_project_path_success(self):
         """Test set_project_path when successful."""
         # Setup
-        with patch('os.path.isdir', return_value=True), \
-             patch('os.makedirs'), \
-             patch.object(self.manager, 'initialize', return_value=True) as mock_initialize:
+        with patch.object(self.manager, 'initialize', return_value=True) as mock_initialize:
             
             # Execute
             result = self.manager.set_project_path("/test/valid/path")
@@ -256,22 +298,20 @@ class TestNeo4jIndexManager(unittest.TestCase):
     def test_set_project_path_invalid_path(self):
         """Test set_project_path with invalid path."""
         # Setup
-        with patch('os.path.isdir', return_value=False):
-            
-            # Execute
-            result = self.manager.set_project_path("/test/invalid/path")
-            
-            # Verify
-            self.assertFalse(result)
-            # project_path should not be updated
-            self.assertEqual("/test/project", self.manager.project_path)
+        self.mock_isdir.return_value = False
+        
+        # Execute
+        result = self.manager.set_project_path("/test/invalid/path")
+        
+        # Verify
+        self.assertFalse(result)
+        # project_path should not be updated
+        self.assertEqual("/test/project", self.manager.project_path)
     
     def test_set_project_path_initialize_fails(self):
         """Test set_project_path when initialize fails."""
         # Setup
-        with patch('os.path.isdir', return_value=True), \
-             patch('os.makedirs'), \
-             patch.object(self.manager, 'initialize', return_value=False) as mock_initialize:
+        with patch.object(self.manager, 'initialize', return_value=False) as mock_initialize:
             
             # Execute
             result = self.manager.set_project_path("/test/valid/path")
@@ -284,15 +324,15 @@ class TestNeo4jIndexManager(unittest.TestCase):
     def test_set_project_path_exception(self):
         """Test set_project_path when an exception occurs."""
         # Setup
-        with patch('os.path.isdir', side_effect=Exception("Test exception")):
-            
-            # Execute
-            result = self.manager.set_project_path("/test/path")
-            
-            # Verify
-            self.assertFalse(result)
-            # project_path should not be updated
-            self.assertEqual("/test/project", self.manager.project_path)
+        self.mock_isdir.side_effect = Exception("Test exception")
+        
+        # Execute
+        result = self.manager.set_project_path("/test/path")
+        
+        # Verify
+        self.assertFalse(result)
+        # project_path should not be updated
+        self.assertEqual("/test/project", self.manager.project_path)
 
 
 if __name__ == "__main__":
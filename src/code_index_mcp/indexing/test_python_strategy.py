@@ -0,0 +1,362 @@
+"""
+Unit tests for PythonParsingStrategy.
+
+This module contains unit tests for the single-pass Python parsing strategy,
+focusing on the symbols and call relationships extracted from small sources.
+"""
+
+import ast
+import os
+import tempfile
+import unittest
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from .strategies.python_strategy import PythonParsingStrategy, SinglePassVisitor
+
+class _QuietTestCase(unittest.TestCase):
+    """Test case that disables logging while its class runs."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Disable logging for these tests only, restoring the previous level afterwards."""
+        super().setUpClass()
+        cls._previous_logging_disable = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the logging level in effect before the class ran."""
+        logging.disable(cls._previous_logging_disable)
+        super().tearDownClass()
+
+
+def _visitor(file_path: str = "module.py") -> SinglePassVisitor:
+    """Create a visitor with fresh output containers."""
+    return SinglePassVisitor({}, [], [], [], {}, {}, {}, file_path, "/test/project")
+
+
+def _parse(source: str, file_path: str = "module.py"):
+    """Parse source with imports exploration disabled."""
+    return PythonParsingStrategy().parse_file(
+        file_path, source, "/test/project", explore_imports=False
+    )
+
+
+class TestPythonParsingStrategyCalls(_QuietTestCase):
+    """Test cases for call relationships recorded by the Python strategy."""
+
+    def test_repeated_call_does_not_fall_through_to_method(self):
+        """Test a repeated call to a function is not attributed to a same-named method."""
+        source = (
+            "class A:\n"
+            "    def helper(self):\n"
+            "        pass\n"
+            "\n"
+            "def helper():\n"
+            "    pass\n"
+            "\n"
+            "def caller():\n"
+            "    helper()\n"
+            "    helper()\n"
+        )
+
+        # Execute
+        symbols, _ = _parse(source)
+
+        # Verify
+        self.assertEqual(["module.py::caller"], symbols["module.py::helper"].called_by)
+        self.assertEqual([], symbols["module.py::A.helper"].called_by)
+
+
+class TestPythonParsingStrategyFiles(_QuietTestCase):
+    """Test cases for file-level information."""
+
+    def test_blank_file_has_no_symbols(self):
+        """Test a whitespace-only file yields an empty FileInfo without parsing."""
+        # Execute
+        symbols, file_info = _parse("\n\n")
+
+        # Verify
+        self.assertEqual({}, symbols)
+        self.assertEqual({"functions": [], "classes": []}, file_info.symbols)
+        self.assertEqual([], file_info.imports)
+        self.assertEqual(2, file_info.line_count)
+
+    def test_line_count_without_trailing_newline(self):
+        """Test the last line is counted whether or not it ends with a newline."""
+        # Execute
+        _, terminated = _parse("x = 1\r\ny = 2\n")
+        _, unterminated = _parse("x = 1\ny = 2")
+
+        # Verify
+        self.assertEqual(2, terminated.line_count)
+        self.assertEqual(2, unterminated.line_count)
+
+    def test_line_count_with_carriage_return_only(self):
+        """Test old Mac style line breaks count like str.splitlines()."""
+        # Execute
+        _, file_info = _parse("x = 1\ry = 2")
+
+        # Verify
+        self.assertEqual(2, file_info.line_count)
+
+
+class TestPythonParsingStrategyDefinitionsOnly(_QuietTestCase):
+    """Test cases for parsing definitions without call analysis."""
+
+    def test_definitions_only_finds_same_symbols_without_calls(self):
+        """Test nested definitions are still found but calls are not recorded."""
+        source = (
+            "try:\n"
+            "    def guarded():\n"
+            "        pass\n"
+            "except ImportError:\n"
+            "    pass\n"
+            "\n"
+            "class Outer:\n"
+            "    class Inner:\n"
+            "        def method(self):\n"
+            "            guarded()\n"
+        )
+
+        # Execute
+        full, _ = _parse(source)
+        definitions, _ = PythonParsingStrategy().parse_file(
+            "module.py", source, "/test/project", explore_imports=False, definitions_only=True
+        )
+
+        # Verify
+        self.assertEqual(
+            {symbol_id: info.type for symbol_id, info in full.items()},
+            {symbol_id: info.type for symbol_id, info in definitions.items()},
+        )
+        self.assertEqual(["module.py::Inner.method"], full["module.py::guarded"].called_by)
+        self.assertEqual([], definitions["module.py::guarded"].called_by)
+
+
+class TestPythonParsingStrategySignatures(_QuietTestCase):
+    """Test cases for function signatures."""
+
+    def test_signature_includes_all_parameter_kinds(self):
+        """Test positional-only, keyword-only and variadic parameters appear in the signature."""
+        source = (
+            "def full(a, /, b, *args, c, **kwargs):\n"
+            "    pass\n"
+            "\n"
+            "def keyword_only(a, *, b):\n"
+            "    pass\n"
+        )
+
+        # Execute
+        symbols, _ = _parse(source)
+
+        # Verify
+        self.assertEqual("def full(a, /, b, *args, c, **kwargs):", symbols["module.py::full"].signature)
+        self.assertEqual("def keyword_only(a, *, b):", symbols["module.py::keyword_only"].signature)
+
+
+class TestPythonParsingStrategyDocstrings(_QuietTestCase):
+    """Test cases for docstrings recorded as source spans."""
+
+    def test_docstring_resolved_from_span(self):
+        """Test a docstring is recorded as a span and read back from the content."""
+        source = (
+            "def documented():\n"
+            "    \"\"\"First line.\n"
+            "\n"
+            "        Indented detail.\n"
+            "    \"\"\"\n"
+            "\n"
+            "def undocumented():\n"
+            "    return 'not a docstring'\n"
+        )
+
+        # Execute
+        symbols, _ = _parse(source)
+        documented = symbols["module.py::documented"]
+
+        # Verify
+        self.assertIsNone(documented.docstring)
+        self.assertEqual("First line.\n\nIndented detail.", documented.get_docstring(source))
+        self.assertIsNone(symbols["module.py::undocumented"].get_docstring(source))
+
+
+class TestPythonParsingStrategyImports(_QuietTestCase):
+    """Test cases for matching call names against imports."""
+
+    def test_matching_imports_refreshed_after_later_import(self):
+        """Test cached import matches are dropped when another import is visited."""
+        # Setup
+        visitor = _visitor()
+        visitor.visit(ast.parse("from os.path import join\n"))
+        self.assertEqual(["os.path.join"], visitor.get_matching_imports("join"))
+
+        # Execute
+        visitor.visit(ast.parse("from shlex import join\n"))
+
+        # Verify
+        self.assertEqual(["os.path.join", "shlex.join"], visitor.get_matching_imports("join"))
+
+    def test_repeated_imports_recorded_once(self):
+        """Test an import repeated in the file appears once in FileInfo.imports."""
+        source = (
+            "import json\n"
+            "from os import path, path\n"
+            "\n"
+            "def load():\n"
+            "    import json\n"
+        )
+
+        # Execute
+        _, file_info = _parse(source)
+
+        # Verify
+        self.assertEqual(["json", "os.path"], file_info.imports)
+
+    def test_matching_imports_require_whole_last_segment(self):
+        """Test an import only matches when its last segment is the called name."""
+        # Setup
+        visitor = _visitor()
+        visitor.visit(ast.parse("from textwrap import rejoin, join\n"))
+
+        # Execute
+        matching_imports = visitor.get_matching_imports("join")
+
+        # Verify
+        self.assertEqual(["textwrap.join"], matching_imports)
+
+    def test_import_spec_resolved_once_across_files(self):
+        """Test an import called from several files is only resolved the first time."""
+        # Setup
+        PythonParsingStrategy.clear_import_spec_cache()
+        self.addCleanup(PythonParsingStrategy.clear_import_spec_cache)
+        source = "from json import dumps\n\ndef dump():\n    dumps({})\n"
+
+        # Execute
+        with patch(
+            "code_index_mcp.indexing.models.ImportCallInfo.get_import_spec", return_value=None
+        ) as get_import_spec:
+            for file_path in ("a.py", "b.py"):
+                PythonParsingStrategy().parse_file(file_path, source, "/test/project")
+
+        # Verify
+        get_import_spec.assert_called_once()
+
+
+class TestPythonParsingStrategyParseMany(_QuietTestCase):
+    """Test cases for parsing files in worker processes."""
+
+    def test_parse_many_matches_parse_file(self):
+        """Test parallel parsing returns the same results, in input order."""
+        files = [
+            ("a.py", "def first():\n    second()\n"),
+            ("b.py", "class Second:\n    def run(self):\n        pass\n"),
+        ]
+
+        # Execute
+        results = PythonParsingStrategy.parse_many(
+            files, "/test/project", explore_imports=False, max_workers=2
+        )
+
+        # Verify
+        self.assertEqual([_parse(content, file_path) for file_path, content in files], results)
+
+    def test_parse_many_reuses_given_executor(self):
+        """Test a pool passed in is used, and left running for the next batch."""
+        # Setup
+        files = [("a.py", "def first():\n    pass\n")]
+
+        # Execute
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = PythonParsingStrategy.parse_many(
+                files, "/test/project", explore_imports=False, executor=executor
+            )
+            second = PythonParsingStrategy.parse_many(
+                files, "/test/project", explore_imports=False, executor=executor
+            )
+
+        # Verify
+        self.assertEqual([_parse(files[0][1], "a.py")], first)
+        self.assertEqual(first, second)
+
+    def test_parse_many_empty(self):
+        """Test no worker pool is needed for an empty file list."""
+        self.assertEqual([], PythonParsingStrategy.parse_many([], "/test/project"))
+
+
+class TestPythonParsingStrategyCache(_QuietTestCase):
+    """Test cases for the content-hash parse cache."""
+
+    def setUp(self):
+        """Set up a temporary cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self):
+        """Remove the temporary cache directory."""
+        self.temp_dir.cleanup()
+
+    def _parse_cached(self, source: str, cache_max_entries: int = 10000):
+        return PythonParsingStrategy(
+            cache_dir=self.cache_dir, cache_max_entries=cache_max_entries
+        ).parse_file("module.py", source, "/test/project", explore_imports=False)
+
+    def test_unchanged_content_is_not_reparsed(self):
+        """Test a second parse of the same content is served from the cache."""
+        # Setup
+        source = "def cached():\n    pass\n"
+        expected = self._parse_cached(source)
+
+        # Execute
+        with patch("ast.parse", side_effect=AssertionError("parsed again")):
+            result = self._parse_cached(source)
+
+        # Verify
+        self.assertEqual(expected, result)
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+    def test_changed_content_is_parsed(self):
+        """Test new content misses the cache and gets its own entry."""
+        # Setup
+        self._parse_cached("def old():\n    pass\n")
+
+        # Execute
+        symbols, _ = self._parse_cached("def new():\n    pass\n")
+
+        # Verify
+        self.assertEqual(["module.py::new"], list(symbols))
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+
+    def test_exploring_imports_is_not_cached(self):
+        """Test parses that explore imports skip the cache, as they depend on other files."""
+        # Execute
+        PythonParsingStrategy(cache_dir=self.cache_dir).parse_file(
+            "module.py", "import json\njson.dumps({})\n", "/test/project", explore_imports=True
+        )
+
+        # Verify
+        self.assertFalse(os.path.exists(self.cache_dir) and os.listdir(self.cache_dir))
+
+    def test_least_recently_used_entries_evicted(self):
+        """Test the oldest entries are removed once the cache grows past its limit."""
+        # Setup
+        entries = []
+        for age, name in enumerate(("first", "second", "third")):
+            self._parse_cached(f"def {name}():\n    pass\n", cache_max_entries=2)
+            entry = (set(os.listdir(self.cache_dir)) - set(entries)).pop()
+            os.utime(os.path.join(self.cache_dir, entry), (age, age))
+            entries.append(entry)
+
+        # Execute
+        self._parse_cached("def fourth():\n    pass\n", cache_max_entries=2)
+
+        # Verify
+        self.assertEqual(2, len(os.listdir(self.cache_dir)))
+        self.assertNotIn(entries[0], os.listdir(self.cache_dir))
+        self.assertNotIn(entries[1], os.listdir(self.cache_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
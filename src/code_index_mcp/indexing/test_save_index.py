@@ -6,42 +6,37 @@ focusing on testing the method with proper mocking.
 """
 
 import unittest
-from unittest.mock import Mock, patch
-import logging
-import os
-import json
-import tempfile
+from unittest.mock import Mock, call, mock_open, patch
 
-from .neo4j_index_manager import Neo4jIndexManager
+from .test_neo4j_index_manager import _Neo4jManagerTestBase
 
-# Disable logging for tests
-logging.disable(logging.CRITICAL)
 
-
-class TestNeo4jIndexManagerSaveIndex(unittest.TestCase):
+class TestNeo4jIndexManagerSaveIndex(_Neo4jManagerTestBase):
     """Test cases for Neo4jIndexManager save_index method."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.manager = Neo4jIndexManager()
-        self.manager.project_path = "/test/project"
-        self.manager.config_path = os.path.join(tempfile.gettempdir(), "test_neo4j_config.json")
-        self.manager.neo4j_uri = "bolt://localhost:7687"
-        self.manager.neo4j_user = "neo4j"
-        self.manager.neo4j_password = "password"
-        self.manager.neo4j_database = "neo4j"
-        self.manager.clustering_enabled = True
-        self.manager.clustering_k = 5
-        self.manager.clustering_max_iterations = 50
-
-    def tearDown(self):
-        """Tear down test fixtures."""
-        # Save config_path before cleanup
-        config_path = self.manager.config_path
-        self.manager.cleanup()
-        # Remove test config file if it exists
-        if config_path and os.path.exists(config_path):
-            os.remove(config_path)
+    @classmethod
+    def setUpClass(cls):
+        """Configure the template manager and save its config once for the tests that read it."""
+        import json
+
+        super().setUpClass()
+        template = cls._template_manager
+        # Nothing is written to this path: saving is captured in memory
+        template.config_path = "/test/project/test_neo4j_config.json"
+        template.neo4j_uri = "bolt://localhost:7687"
+        template.neo4j_user = "neo4j"
+        template.neo4j_password = "password"
+        template.neo4j_database = "neo4j"
+        template.clustering_enabled = True
+        template.clustering_k = 5
+        template.clustering_max_iterations = 50
+
+        config_file = mock_open()
+        with patch('builtins.open', config_file):
+            template._save_neo4j_config()
+        cls._config_open_calls = config_file.call_args_list
+        written = config_file.return_value.write.call_args_list
+        cls._config = json.loads("".join(write.args[0] for write in written))
 
     def test_save_index_success(self):
         """Test save_index when _save_neo4j_config succeeds."""
@@ -67,26 +62,23 @@ class TestNeo4jIndexManagerSaveIndex(unittest.TestCase):
         self.assertFalse(result)
         self.manager._save_neo4j_config.assert_called_once()
 
+    def test_save_neo4j_config_opens_config_path(self):
+        """Test _save_neo4j_config writes a single file at config_path."""
+        self.assertEqual([call(self.manager.config_path, "w")], self._config_open_calls)
+
     def test_save_neo4j_config(self):
-        """Test _save_neo4j_config method."""
-        # Execute the actual _save_neo4j_config method
-        self.manager._save_neo4j_config()
-        
-        # Verify
-        self.assertTrue(os.path.exists(self.manager.config_path))
-        
-        # Check file content
-        with open(self.manager.config_path, 'r') as f:
-            config = json.load(f)
-        
-        # Verify config content
-        self.assertEqual(self.manager.neo4j_uri, config["uri"])
-        self.assertEqual(self.manager.neo4j_user, config["user"])
-        self.assertEqual(self.manager.neo4j_password, config["password"])
-        self.assertEqual(self.manager.neo4j_database, config["database"])
-        self.assertEqual(self.manager.clustering_enabled, config["clustering"]["enabled"])
-        self.assertEqual(self.manager.clustering_k, config["clustering"]["k"])
-        self.assertEqual(self.manager.clustering_max_iterations, config["clustering"]["max_iterations"])
+        """Test _save_neo4j_config saves the connection settings."""
+        self.assertEqual(self.manager.neo4j_uri, self._config["uri"])
+        self.assertEqual(self.manager.neo4j_user, self._config["user"])
+        self.assertEqual(self.manager.neo4j_password, self._config["password"])
+        self.assertEqual(self.manager.neo4j_database, self._config["database"])
+
+    def test_save_neo4j_config_clustering(self):
+        """Test _save_neo4j_config saves the clustering settings."""
+        clustering = self._config["clustering"]
+        self.assertEqual(self.manager.clustering_enabled, clustering["enabled"])
+        self.assertEqual(self.manager.clustering_k, clustering["k"])
+        self.assertEqual(self.manager.clustering_max_iterations, clustering["max_iterations"])
 
     def test_save_neo4j_config_no_config_path(self):
         """Test _save_neo4j_config when config_path is not set."""
@@ -0,0 +1,134 @@
+"""
+Unit tests for SymbolIDNormalizer.
+
+This module contains unit tests for the path classification and symbol IDs
+produced by SymbolIDNormalizer. Paths are never touched on disk, so the
+tests use synthetic absolute paths.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import logging
+from unittest.mock import patch
+
+from .utils.symbol_id_normalizer import SymbolIDNormalizer
+
+PROJECT_ROOT = os.path.abspath("/test/project")
+VENV_ROOT = os.path.join(PROJECT_ROOT, ".venv")
+SITE_PACKAGES = os.path.join(VENV_ROOT, "lib", "python3.12", "site-packages")
+
+
+class TestSymbolIDNormalizer(unittest.TestCase):
+    """Test cases for normalized paths and symbol IDs."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the normalizer shared by the tests; it holds no per-test state."""
+        # Disable logging for these tests only, restoring the previous level afterwards
+        cls._previous_logging_disable = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+        cls.normalizer = SymbolIDNormalizer(PROJECT_ROOT, VENV_ROOT)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the logging level in effect before the class ran."""
+        logging.disable(cls._previous_logging_disable)
+
+    def test_project_file_is_relative(self):
+        """Test a project file is named relative to the project root."""
+        file_path = os.path.join(PROJECT_ROOT, "src", "module.py")
+
+        # Execute
+        symbol_id = self.normalizer.create_symbol_id(file_path, "MyClass.method")
+
+        # Verify
+        self.assertEqual("src/module.py::MyClass.method", symbol_id)
+
+    def test_normalized_project_file_skips_abspath(self):
+        """Test an already-normalized project path is named without resolving it again."""
+        # Setup
+        normalizer = SymbolIDNormalizer(PROJECT_ROOT, VENV_ROOT)
+        file_path = os.path.join(PROJECT_ROOT, "src", "module.py")
+
+        # Execute
+        with patch("os.path.abspath") as abspath:
+            normalized = normalizer.normalize_path(file_path)
+
+        # Verify
+        self.assertEqual("src/module.py", normalized)
+        abspath.assert_not_called()
+
+    def test_dot_segments_are_resolved(self):
+        """Test '.' and '..' segments below the project root still go through abspath."""
+        test_cases = [
+            (os.path.join(PROJECT_ROOT, "src", "..", "module.py"), "module.py"),
+            (os.path.join(PROJECT_ROOT, ".", "src", "module.py"), "src/module.py"),
+            (
+                os.path.join(PROJECT_ROOT, "..", "other", "module.py"),
+                "external://" + os.path.abspath(os.path.join(PROJECT_ROOT, "..", "other", "module.py")).replace(os.sep, "/"),
+            ),
+        ]
+
+        for file_path, expected in test_cases:
+            with self.subTest(file_path=file_path):
+                self.assertEqual(expected, self.normalizer.normalize_path(file_path))
+
+    def test_venv_inside_project_is_project_relative(self):
+        """Test the project root claims a venv under it, keeping existing IDs stable."""
+        file_path = os.path.join(SITE_PACKAGES, "requests", "api.py")
+
+        # Execute
+        normalized = self.normalizer.normalize_path(file_path)
+
+        # Verify
+        self.assertEqual(".venv/lib/python3.12/site-packages/requests/api.py", normalized)
+
+    def test_venv_site_packages_found_up_front(self):
+        """Test a venv's site-packages directory is found once and names packages below it."""
+        # Setup
+        with tempfile.TemporaryDirectory() as venv_root:
+            site_packages = os.path.join(venv_root, "lib", "python3.12", "site-packages")
+            os.makedirs(site_packages)
+            normalizer = SymbolIDNormalizer(PROJECT_ROOT, venv_root)
+
+        # Execute
+        normalized = normalizer.normalize_path(os.path.join(site_packages, "requests", "api.py"))
+
+        # Verify
+        self.assertEqual("venv://requests/api.py", normalized)
+
+    def test_stdlib_file(self):
+        """Test a standard library module gets a stdlib:// path without the version directory."""
+        self.assertEqual("stdlib://json/__init__.py", self.normalizer.normalize_path(json.__file__))
+
+    def test_sibling_with_shared_prefix_is_external(self):
+        """Test a directory that only shares the project root's name prefix is external."""
+        file_path = PROJECT_ROOT + "_other" + os.sep + "module.py"
+
+        # Execute
+        normalized = self.normalizer.normalize_path(file_path)
+
+        # Verify
+        self.assertEqual("external://" + file_path.replace(os.sep, "/"), normalized)
+
+    def test_repeated_path_resolved_once(self):
+        """Test symbols in the same file only resolve the file path the first time."""
+        # Setup
+        normalizer = SymbolIDNormalizer(PROJECT_ROOT, VENV_ROOT)
+        file_path = os.path.join(PROJECT_ROOT, "module.py")
+
+        normalizer.create_symbol_id(file_path, "a")
+
+        # Execute
+        with patch("os.path.abspath") as abspath:
+            symbol_ids = [normalizer.create_symbol_id(file_path, name) for name in ("a", "b")]
+
+        # Verify
+        self.assertEqual(["module.py::a", "module.py::b"], symbol_ids)
+        abspath.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,67 @@ This module provides path normalization to ensure that the same function/class
 always generates the same symbol ID regardless of parsing context.
 """
 
+import glob
 import os
+import re
 import sys
+import sysconfig
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Per-normalizer memo sizes: paths repeat for every symbol in a file, symbol IDs less often
+_PATH_CACHE_SIZE = 4096
+_SYMBOL_ID_CACHE_SIZE = 16384
+
+# On POSIX paths already use forward slashes and need no conversion
+_IS_POSIX = os.sep == '/'
+
+# A pythonX.Y directory component, stripped from stdlib paths
+_PYTHON_VERSION_DIR = re.compile(r"(?:^|/)python\d+(?:\.\d+)?/")
+
+# Anything os.path.abspath would rewrite in an absolute path: '.' or '..'
+# segments, repeated separators, or a trailing separator
+_SEPARATORS = re.escape(os.sep + (os.altsep or ''))
+_UNNORMALIZED_PATH = re.compile(
+    rf"[{_SEPARATORS}]\.{{1,2}}(?:[{_SEPARATORS}]|$)|[{_SEPARATORS}]{{2}}|[{_SEPARATORS}]$"
+)
+
+
+@lru_cache(maxsize=1)
+def _discover_stdlib_paths() -> frozenset[str]:
+    """Get the absolute paths to standard library directories.
+
+    The interpreter's layout does not change while it runs, so the lookup
+    is done once per process and shared by all normalizers.
+
+    Returns:
+        Frozen set of absolute paths to stdlib locations
+    """
+    paths = sysconfig.get_paths()
+    version_dir = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    candidates = {
+        paths['stdlib'],
+        paths['platstdlib'],
+        # Base installation layout, for interpreters whose scheme points elsewhere
+        os.path.join(sys.base_prefix, 'lib', version_dir),
+    }
+    return frozenset(str(Path(path).resolve()) for path in candidates)
+
+
+def find_site_packages(venv_root: str) -> set[str]:
+    """Find the site-packages directories of a virtual environment.
+
+    Args:
+        venv_root: Absolute path to the virtual environment root
+
+    Returns:
+        Set of absolute site-packages paths (POSIX and Windows layouts)
+    """
+    site_packages = set(glob.glob(os.path.join(venv_root, 'lib', 'python*', 'site-packages')))
+    site_packages.update(glob.glob(os.path.join(venv_root, 'Lib', 'site-packages')))
+    return site_packages
+
 
 class SymbolIDNormalizer:
     """Normalizes file paths and creates consistent symbol IDs.
@@ -22,6 +78,16 @@ class SymbolIDNormalizer:
     - Standard library: stdlib://module.py::SymbolName
     - External: external:///abs/path/file.py::SymbolName
     """
+
+    __slots__ = (
+        "project_root",
+        "venv_root",
+        "stdlib_paths",
+        "_prefixes",
+        "_project_prefix",
+        "_normalize_path_cached",
+        "_create_symbol_id_cached",
+    )
     
     def __init__(self, project_root: str, venv_root: Optional[str] = None):
         """Initialize the normalizer with project and venv paths.
@@ -33,84 +99,60 @@ class SymbolIDNormalizer:
         self.project_root = os.path.abspath(project_root)
         self.venv_root = os.path.abspath(venv_root) if venv_root else None
         
-        # Determine standard library paths
-        self.stdlib_paths = self._get_stdlib_paths()
-    
-    def _get_stdlib_paths(self) -> set[str]:
-        """Get set of absolute paths to standard library directories.
-        
-        Returns:
-            Set of absolute paths to stdlib locations
-        """
-        stdlib_paths = set()
-        
-        # Get paths from sys.path that are part of the Python installation
-        for path_str in sys.path:
-            path = Path(path_str).resolve()
-            
-            # Standard library is typically in lib/pythonX.Y/ directory
-            if 'site-packages' not in str(path):
-                # Check if this looks like a stdlib path
-                if any(part.startswith('python') for part in path.parts):
-                    stdlib_paths.add(str(path))
-        
-        # Also add the base prefix paths
-        if hasattr(sys, 'base_prefix'):
-            base_prefix = Path(sys.base_prefix).resolve()
-            stdlib_paths.add(str(base_prefix / 'lib'))
-        
-        return stdlib_paths
-    
-    def _is_in_stdlib(self, file_path: str) -> bool:
-        """Check if a file path is in the standard library.
-        
-        Args:
-            file_path: Absolute or relative file path
-            
-        Returns:
-            True if file is in standard library, False otherwise
-        """
-        abs_path = os.path.abspath(file_path)
-        
-        # Check if path starts with any known stdlib path
-        for stdlib_path in self.stdlib_paths:
-            if abs_path.startswith(stdlib_path):
-                # Make sure it's not in site-packages
-                if 'site-packages' not in abs_path:
-                    return True
-        
-        return False
-    
-    def _is_in_venv(self, file_path: str) -> bool:
-        """Check if a file path is in the virtual environment.
-        
-        Args:
-            file_path: Absolute or relative file path
-            
-        Returns:
-            True if file is in venv, False otherwise
-        """
-        if not self.venv_root:
-            return False
-        
-        abs_path = os.path.abspath(file_path)
-        return abs_path.startswith(self.venv_root)
+        # Determine standard library paths (shared by every normalizer)
+        self.stdlib_paths = _discover_stdlib_paths()
+
+        # (prefix, category) for every known root. The project comes first and
+        # keeps everything under it, a venv inside the project included, so
+        # existing project-relative IDs stay stable. The other roots follow
+        # longest prefix first so site-packages beats its venv; the sort is
+        # stable, so on a tie venv beats stdlib.
+        prefixes = []
+        if self.venv_root:
+            prefixes.append((os.path.join(self.venv_root, ''), 'venv'))
+            # Installed packages are named from below site-packages
+            prefixes.extend(
+                (os.path.join(path, ''), 'site-packages')
+                for path in find_site_packages(self.venv_root)
+            )
+        prefixes.extend((os.path.join(path, ''), 'stdlib') for path in self.stdlib_paths)
+        self._project_prefix = os.path.join(self.project_root, '')
+        self._prefixes = [(self._project_prefix, 'project')] + sorted(
+            prefixes, key=lambda entry: -len(entry[0])
+        )
+
+        # Memos are per instance so normalizers for different projects never share entries
+        self._normalize_path_cached = lru_cache(maxsize=_PATH_CACHE_SIZE)(self._normalize_path_impl)
+        self._create_symbol_id_cached = lru_cache(maxsize=_SYMBOL_ID_CACHE_SIZE)(
+            self._create_symbol_id_impl
+        )
     
-    def _is_in_project(self, file_path: str) -> bool:
-        """Check if a file path is in the project directory.
+    def _classify(self, abs_path: str) -> tuple[str, str]:
+        """Find which kind of root an absolute path falls under.
         
         Args:
-            file_path: Absolute or relative file path
+            abs_path: Normalized absolute file path
             
         Returns:
-            True if file is in project, False otherwise
+            Tuple of (category, rel_path) where category is 'project',
+            'site-packages', 'venv', 'stdlib' or 'external' and rel_path is the path below that root
+            (the absolute path itself for external files)
         """
-        abs_path = os.path.abspath(file_path)
-        return abs_path.startswith(self.project_root)
+        startswith = abs_path.startswith
+        for prefix, category in self._prefixes:
+            if startswith(prefix):
+                # Packages installed next to the stdlib are not part of it
+                if category == 'stdlib' and 'site-packages' in abs_path:
+                    continue
+                return category, abs_path[len(prefix):]
+        return 'external', abs_path
     
     def normalize_path(self, file_path: str) -> str:
         """Normalize a file path to a consistent format with appropriate prefix.
         
+        Results are memoized per file_path, so a relative path is resolved
+        against the working directory in effect when it is first seen.
+        
         Args:
             file_path: Absolute or relative file path
             
@@ -121,52 +163,56 @@ class SymbolIDNormalizer:
             - stdlib://module.py for standard library
             - external:///abs/path for external files
         """
+        return self._normalize_path_cached(file_path)
+    
+    def _normalize_path_impl(self, file_path: str) -> str:
+        """Uncached normalize_path."""
+        # Most paths are already-normalized project files, and the project root
+        # claims everything under it, so they need neither abspath nor _classify
+        if file_path.startswith(self._project_prefix) and not _UNNORMALIZED_PATH.search(file_path):
+            rel_path = file_path[len(self._project_prefix):]
+            return rel_path if _IS_POSIX else rel_path.replace(os.sep, '/')
+
         abs_path = os.path.abspath(file_path)
+        # abspath has normalized the path, so the part after a root's prefix is
+        # exactly what os.path.relpath would return
+        category, rel_path = self._classify(abs_path)
+        if not _IS_POSIX:
+            # Normalize path separators to forward slashes
+            abs_path = abs_path.replace(os.sep, '/')
+            rel_path = rel_path.replace(os.sep, '/')
         
-        # Check each category in priority order
-        if self._is_in_project(abs_path):
+        if category == 'project':
             # Project file: use relative path from project root
-            rel_path = os.path.relpath(abs_path, self.project_root)
-            # Normalize path separators to forward slashes
-            return rel_path.replace(os.sep, '/')
+            return rel_path
         
-        elif self._is_in_venv(abs_path):
-            # Venv file: extract package structure after site-packages
+        elif category == 'site-packages':
+            # Venv package: the path below site-packages is the package structure
+            return f"venv://{rel_path}"
+        
+        elif category == 'venv':
+            # Other venv file, e.g. a site-packages directory not found up front:
+            # extract package structure after site-packages
             if 'site-packages' in abs_path:
                 # Find site-packages and get path after it
-                parts = abs_path.split('site-packages' + os.sep, 1)
+                parts = abs_path.split('site-packages/', 1)
                 if len(parts) == 2:
-                    package_path = parts[1].replace(os.sep, '/')
-                    return f"venv://{package_path}"
+                    return f"venv://{parts[1]}"
             
             # Fallback: use path relative to venv root
-            rel_path = os.path.relpath(abs_path, self.venv_root)
-            return f"venv://{rel_path.replace(os.sep, '/')}"
+            return f"venv://{rel_path}"
         
-        elif self._is_in_stdlib(abs_path):
+        elif category == 'stdlib':
             # Standard library: extract module path
             # Try to get just the module structure (e.g., "email/mime/text.py")
-            for stdlib_path in self.stdlib_paths:
-                if abs_path.startswith(stdlib_path):
-                    rel_path = os.path.relpath(abs_path, stdlib_path)
-                    # Remove leading python version directories
-                    parts = Path(rel_path).parts
-                    # Skip pythonX.Y directory if present
-                    start_idx = 0
-                    for i, part in enumerate(parts):
-                        if part.startswith('python'):
-                            start_idx = i + 1
-                            break
-                    
-                    clean_path = '/'.join(parts[start_idx:])
-                    return f"stdlib://{clean_path}"
-            
-            # Fallback
-            return f"stdlib://{Path(abs_path).name}"
+            # Skip everything up to a pythonX.Y directory if present
+            version_dir = _PYTHON_VERSION_DIR.search(rel_path)
+            clean_path = rel_path[version_dir.end():] if version_dir else rel_path
+            return f"stdlib://{clean_path}"
         
         else:
             # External file: use absolute path with external prefix
-            return f"external://{abs_path.replace(os.sep, '/')}"
+            return f"external://{abs_path}"
     
     def create_symbol_id(self, file_path: str, symbol_name: str) -> str:
         """Create a consistent symbol ID from file path and symbol name.
@@ -178,5 +224,9 @@ class SymbolIDNormalizer:
         Returns:
             Symbol ID in format: normalized_path::symbol_name
         """
+        return self._create_symbol_id_cached(file_path, symbol_name)
+    
+    def _create_symbol_id_impl(self, file_path: str, symbol_name: str) -> str:
+        """Uncached create_symbol_id."""
         normalized_path = self.normalize_path(file_path)
-        return f"{normalized_path}::{symbol_name}"
+        return normalized_path + "::" + symbol_name